@@ -1,3 +1,6 @@
+import hashlib
+import os
+import threading
 from collections import defaultdict
 from pathlib import Path
 
@@ -5,8 +8,45 @@ from material.plugins.social.plugin import SocialPlugin as OrigSocialPlugin
 
 
 class LocalSocialPlugin(OrigSocialPlugin):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 카드 렌더링은 스레드풀에서 수행되므로, ImageFont 객체는 스레드별로 캐싱합니다.
+        self._font_cache = threading.local()
+
+    def on_config(self, config):
+        super().on_config(config)
+
+        cache_dir = getattr(self, "cache", None)
+        if cache_dir:
+            # 기본 플러그인은 (site_name, title, description) 해시로만 PNG 를 캐싱하므로,
+            # 색상이나 폰트 파일이 바뀌면 이전 이미지가 재사용됩니다. 이들을 캐시 폴더 이름에 반영합니다.
+            self.cache = os.path.join(cache_dir, self._get_render_options_key())
+            os.makedirs(self.cache, exist_ok=True)
+
+    def _get_render_options_key(self) -> str:
+        parts = [repr(sorted(getattr(self, "color", {}).items()))]
+        for weight, file_path in sorted(dict(getattr(self, "font", None) or {}).items()):
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except (OSError, TypeError):
+                mtime = 0
+            parts.append(f"{weight}:{file_path}:{mtime}")
+        return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_font(self, kind, size):
+        fonts = getattr(self._font_cache, "fonts", None)
+        if fonts is None:
+            fonts = self._font_cache.fonts = {}
+
+        key = (kind, size)
+        if key not in fonts:
+            fonts[key] = super()._get_font(kind, size)
+        return fonts[key]
 
     def _load_font(self, config):
+        # mkdocs serve 등으로 설정이 다시 로딩되면, 이전 폰트 캐시는 버립니다.
+        self._font_cache = threading.local()
+
         font_path = self.config.cards_layout_options.get("font_path")
 
         if isinstance(font_path, dict):
@@ -1,3 +1,4 @@
+import os
 from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
 
@@ -28,6 +29,54 @@ logo = """
 """
 
 
+# MCP 도구 등록이 필요한 명령. 그 외 명령(--version, --help, setup-* 등)에서는 도구 모듈을 임포트하지 않습니다.
+TOOL_COMMANDS = {
+    "run",
+    "list",
+    "tools-list",
+    "tools-call",
+    "resources-list",
+    "resource-templates-list",
+    "prompts-list",
+}
+
+# Django 초기화(django.setup)가 필요없는 명령. --version, --help 와 함께 Django 앱 로딩 비용 없이 실행됩니다.
+NO_DJANGO_COMMANDS = {
+    "run-sse-proxy",
+    "kill",
+    "release-note",
+}
+
+
+def import_tools():
+    from pyhub.mcptools.core.init import init_django_and_mcp
+
+    init_django_and_mcp()
+
+    import_module("pyhub.mcptools.files.tools")
+    import_module("pyhub.mcptools.fs.tools")
+    import_module("pyhub.mcptools.maps.tools")
+    # import_module("pyhub.mcptools.music.tools")
+    import_module("pyhub.mcptools.search.tools")
+
+    import_module("pyhub.mcptools.microsoft.tools")
+
+    if settings.USE_GOOGLE_SHEETS:
+        import_module("pyhub.mcptools.google.tools")
+
+    if OS.current_is_macos():
+        import_module("pyhub.mcptools.apple.tools")
+
+    if settings.USE_IMAGES_TOOLS:
+        import_module("pyhub.mcptools.images.tools")
+
+    if settings.USE_PYTHON_TOOLS:
+        import_module("pyhub.mcptools.python.tools")
+
+    if settings.USE_SENTIMENT_TOOLS:
+        import_module("pyhub.mcptools.sentiment.tools")
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -38,11 +87,17 @@ def main(
             v = version("pyhub-mcptools")
         except PackageNotFoundError:
             v = "not found"
-        console.print(v, highlight=False)
+        print(v)
     else:
         if ctx.invoked_subcommand is None:
             console.print(logo)
             console.print(ctx.get_help())
+        elif ctx.invoked_subcommand in TOOL_COMMANDS:
+            import_tools()
+        elif ctx.invoked_subcommand not in NO_DJANGO_COMMANDS:
+            from pyhub.mcptools.core.init import init_django_and_mcp
+
+            init_django_and_mcp()
 
 
 if __name__ == "__main__":
@@ -56,60 +111,18 @@ if __name__ == "__main__":
 
     multiprocessing.freeze_support()
 
-    # Initialize Django before importing any modules that use it
-    from pyhub.mcptools.core.init import init_django_and_mcp
-
-    init_django_and_mcp()
+    # 여기서는 Django settings 모듈만 지정하고, django.setup()은 main 콜백에서 필요한 명령에 대해서만 수행합니다.
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pyhub.mcptools.core.settings")
 
     #
     # commands
     #
-    import_module("pyhub.mcptools.files.__main__")
-    import_module("pyhub.mcptools.fs.__main__")
-    import_module("pyhub.mcptools.maps.__main__")
-    import_module("pyhub.mcptools.search.__main__")
-
-    import_module("pyhub.mcptools.microsoft.__main__")
-
-    if settings.USE_GOOGLE_SHEETS:
-        import_module("pyhub.mcptools.google.__main__")
-
-    if OS.current_is_macos():
-        import_module("pyhub.mcptools.apple.__main__")
-
-    if settings.USE_IMAGES_TOOLS:
-        import_module("pyhub.mcptools.images.__main__")
-
-    if settings.USE_PYTHON_TOOLS:
-        import_module("pyhub.mcptools.python.__main__")
-
-    if settings.USE_SENTIMENT_TOOLS:
-        import_module("pyhub.mcptools.sentiment.__main__")
-
-    #
-    # Tools
-    #
-    import_module("pyhub.mcptools.files.tools")
-    import_module("pyhub.mcptools.fs.tools")
-    import_module("pyhub.mcptools.maps.tools")
-    # import_module("pyhub.mcptools.music.tools")
-    import_module("pyhub.mcptools.search.tools")
-
-    import_module("pyhub.mcptools.microsoft.tools")
-
     if settings.USE_GOOGLE_SHEETS:
-        import_module("pyhub.mcptools.google.tools")
+        # Initialize Django before importing any modules that use it
+        from pyhub.mcptools.core.init import init_django_and_mcp
 
-    if OS.current_is_macos():
-        import_module("pyhub.mcptools.apple.tools")
+        init_django_and_mcp()
 
-    if settings.USE_IMAGES_TOOLS:
-        import_module("pyhub.mcptools.images.tools")
-
-    if settings.USE_PYTHON_TOOLS:
-        import_module("pyhub.mcptools.python.tools")
-
-    if settings.USE_SENTIMENT_TOOLS:
-        import_module("pyhub.mcptools.sentiment.tools")
+        import_module("pyhub.mcptools.google.cli_commands")
 
     app()
@@ -6,9 +6,17 @@ from pyhub.mcptools.apple.utils import (
     applescript_run,
     escape_applescript_string,
     parse_applescript_record,
+    parse_applescript_records,
 )
 
 
+def _split_list_fields(contact_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse the comma-separated Emails and Phones fields into lists."""
+    for key in ("Emails", "Phones"):
+        contact_dict[key] = [item.strip() for item in contact_dict.get(key, "").split(",") if item.strip()]
+    return contact_dict
+
+
 class ContactsClient:
     """Client for interacting with Apple Contacts app."""
 
@@ -150,23 +158,8 @@ class ContactsClient:
         """
 
         result = await applescript_run(script)
-        contacts = []
-
-        if result and result != "missing value":
-            for contact_data in result.split("<<<CONTACT_END>>>"):
-                if contact_data.strip():
-                    contact_dict = parse_applescript_record(contact_data.strip())
-                    if contact_dict:
-                        # Parse emails and phones into lists
-                        emails_str = contact_dict.get("Emails", "")
-                        contact_dict["Emails"] = [e.strip() for e in emails_str.split(",") if e.strip()]
-
-                        phones_str = contact_dict.get("Phones", "")
-                        contact_dict["Phones"] = [p.strip() for p in phones_str.split(",") if p.strip()]
-
-                        contacts.append(contact_dict)
-
-        return contacts
+        records = parse_applescript_records(result, "<<<CONTACT_END>>>")
+        return [_split_list_fields(contact_dict) for contact_dict in records]
 
     async def get_contact(self, contact_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific contact by ID.
@@ -287,14 +280,7 @@ class ContactsClient:
         if result and result.strip() != "NOT_FOUND":
             contact_dict = parse_applescript_record(result.strip())
             if contact_dict:
-                # Parse emails and phones into lists
-                emails_str = contact_dict.get("Emails", "")
-                contact_dict["Emails"] = [e.strip() for e in emails_str.split(",") if e.strip()]
-
-                phones_str = contact_dict.get("Phones", "")
-                contact_dict["Phones"] = [p.strip() for p in phones_str.split(",") if p.strip()]
-
-                return contact_dict
+                return _split_list_fields(contact_dict)
 
         return None
 
@@ -4,9 +4,127 @@ import email
 from email import policy
 from typing import Optional, Union
 
+from pyhub.mcptools.apple.utils import applescript_run_compiled
 from pyhub.mcptools.core.email_types import Email, EmailFolderType
 from pyhub.mcptools.core.email_utils import parse_email_list
-from pyhub.mcptools.microsoft.excel.utils import applescript_run
+
+# The scripts below are compiled once and receive their parameters through argv,
+# so user input is never interpolated into AppleScript source.
+
+# argv: max hours, folder kind (inbox/sent/mailbox), mailbox name, query
+LIST_EMAILS_SCRIPT = """
+on run argv
+    set maxHours to (item 1 of argv) as integer
+    set folderKind to item 2 of argv
+    set folderName to item 3 of argv
+    set queryText to item 4 of argv
+
+    tell application "Mail"
+        set outputList to {}
+        if folderKind is "sent" then
+            set theBox to sent mailbox
+        else if folderKind is "mailbox" then
+            set theBox to mailbox folderName
+        else
+            set theBox to inbox
+        end if
+        set thresholdAt to (current date) - (maxHours * hours)
+
+        -- Let Mail evaluate the filters in a whose clause instead of walking every message.
+        -- "contains" ignores case by default.
+        if queryText is "" then
+            set theMessages to (messages of theBox whose date received >= thresholdAt)
+        else
+            set theMessages to (messages of theBox whose date received >= thresholdAt and subject contains queryText)
+        end if
+
+        repeat with theMessage in theMessages
+            try
+                set subjectRaw to subject of theMessage as string
+
+                -- Get basic message info
+                set theSender to sender of theMessage
+                set theSenderName to extract name from theSender
+                set theSenderEmail to extract address from theSender
+                set theTo to address of to recipient of theMessage as string
+                set theCC to ""
+                try
+                    set theCC to address of cc recipient of theMessage as string
+                end try
+                set theDate to date received of theMessage
+                set theMessageID to message id of theMessage
+
+                -- Get email content
+                set theContent to ""
+                try
+                    set theContent to content of theMessage
+                end try
+
+                -- Get raw source if available
+                set theSource to ""
+                try
+                    set theSource to source of theMessage
+                end try
+
+                -- Add all fields to the list
+                set end of outputList to "Identifier: " & theMessageID
+                set end of outputList to "Subject: " & subjectRaw
+                set end of outputList to "SenderName: " & theSenderName
+                set end of outputList to "SenderEmail: " & theSenderEmail
+                set end of outputList to "To: " & theTo
+                set end of outputList to "CC: " & theCC
+                set end of outputList to "ReceivedAt: " & theDate
+                set end of outputList to "Content: " & theContent
+                set end of outputList to "RawSource: " & theSource
+                set end of outputList to "<<<EMAIL_DELIMITER>>>"
+            end try
+        end repeat
+
+        -- Convert list to string with unique delimiter
+        set AppleScript's text item delimiters to "<<<FIELD_DELIMITER>>>"
+        set output to outputList as string
+        return output
+    end tell
+end run
+"""
+
+# argv: subject, content, TO/CC/BCC addresses (newline-separated), compose only (true/false)
+SEND_EMAIL_SCRIPT = """
+on run argv
+    set theSubject to item 1 of argv
+    set theContent to item 2 of argv
+    set toAddresses to paragraphs of (item 3 of argv)
+    set ccAddresses to paragraphs of (item 4 of argv)
+    set bccAddresses to paragraphs of (item 5 of argv)
+    set composeOnly to (item 6 of argv) is "true"
+
+    tell application "Mail"
+        set messageProperties to {subject:theSubject, content:theContent, visible:composeOnly}
+        set newMessage to make new outgoing message with properties messageProperties
+
+        tell newMessage
+            repeat with theAddress in toAddresses
+                make new to recipient with properties {address:(theAddress as string)}
+            end repeat
+            repeat with theAddress in ccAddresses
+                make new cc recipient with properties {address:(theAddress as string)}
+            end repeat
+            repeat with theAddress in bccAddresses
+                make new bcc recipient with properties {address:(theAddress as string)}
+            end repeat
+        end tell
+
+        if composeOnly then
+            -- Just display the compose window
+            activate
+        else
+            send newMessage
+        end if
+
+        return "SUCCESS"
+    end tell
+end run
+"""
 
 
 def html_to_text(html: str) -> str:
@@ -33,82 +151,26 @@ class AppleMailClient:
         self.current_email: dict[str, str] = {}
         self.emails: list[Email] = []
 
-    def _build_applescript(
+    def _build_applescript_args(
         self,
         max_hours: int,
         email_folder_type: Optional[EmailFolderType] = None,
         email_folder_name: Optional[str] = None,
         query: Optional[str] = None,
-    ) -> str:
+    ) -> tuple[str, ...]:
         if email_folder_type == EmailFolderType.SENT:
-            folder_script = "set theMessages to messages of sent mailbox"
+            folder_kind = "sent"
         elif email_folder_name:
-            folder_script = f'set theMessages to messages of mailbox "{email_folder_name}"'
+            folder_kind = "mailbox"
         else:
-            folder_script = "set theMessages to messages of inbox"
-
-        return f"""
-            tell application \"Mail\"
-                set outputList to {{}}
-                {folder_script}
-                set thresholdAt to (current date) - ({max_hours} * hours)
-                repeat with theMessage in theMessages
-                    try
-                        set subjectRaw to subject of theMessage as string
-                        set subjectLower to do shell script "echo " & quoted form of subjectRaw & \\
-                            " | tr '[:upper:]' '[:lower:]'"
-
-                        {f'if subjectLower contains "{query.lower()}" then' if query else 'if true then'}
-                            set messageDate to date received of theMessage
-                            if messageDate < thresholdAt then
-                                exit repeat
-                            end if
-
-                            -- Get basic message info
-                            set theSender to sender of theMessage
-                            set theSenderName to extract name from theSender
-                            set theSenderEmail to extract address from theSender
-                            set theTo to address of to recipient of theMessage as string
-                            set theCC to ""
-                            try
-                                set theCC to address of cc recipient of theMessage as string
-                            end try
-                            set theDate to date received of theMessage
-                            set theMessageID to message id of theMessage
-
-                            -- Get email content
-                            set theContent to ""
-                            try
-                                set theContent to content of theMessage
-                            end try
-
-                            -- Get raw source if available
-                            set theSource to ""
-                            try
-                                set theSource to source of theMessage
-                            end try
-
-                            -- Add all fields to the list
-                            set end of outputList to "Identifier: " & theMessageID
-                            set end of outputList to "Subject: " & subjectRaw
-                            set end of outputList to "SenderName: " & theSenderName
-                            set end of outputList to "SenderEmail: " & theSenderEmail
-                            set end of outputList to "To: " & theTo
-                            set end of outputList to "CC: " & theCC
-                            set end of outputList to "ReceivedAt: " & theDate
-                            set end of outputList to "Content: " & theContent
-                            set end of outputList to "RawSource: " & theSource
-                            set end of outputList to "<<<EMAIL_DELIMITER>>>"
-                        end if
-                    end try
-                end repeat
-
-                -- Convert list to string with unique delimiter
-                set AppleScript's text item delimiters to "<<<FIELD_DELIMITER>>>"
-                set output to outputList as string
-                return output
-            end tell
-        """
+            folder_kind = "inbox"
+
+        return (
+            str(max_hours),
+            folder_kind,
+            email_folder_name or "",
+            query or "",
+        )
 
     def _parse_email_body(self, raw_source: str, content: str) -> str:
         if not raw_source and not content:
@@ -201,14 +263,14 @@ class AppleMailClient:
         email_folder_type: Optional[EmailFolderType] = None,
         email_folder_name: Optional[str] = None,
     ) -> list[Email]:
-        script = self._build_applescript(
+        args = self._build_applescript_args(
             max_hours,
             email_folder_type,
             email_folder_name,
             query,
         )
 
-        stdout_str = (await applescript_run(script)).strip()
+        stdout_str = (await applescript_run_compiled("mail_list_emails", LIST_EMAILS_SCRIPT, *args)).strip()
         self._process_output(stdout_str)
 
         return self._filter_emails(query)
@@ -259,74 +321,20 @@ async def send_email(
     cc_list = parse_email_list(cc_list)
     bcc_list = parse_email_list(bcc_list)
 
-    # Escape special characters for AppleScript
-    def escape_applescript(text: str) -> str:
-        if not text:
-            return ""
-        return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r")
-
     # Use plain text message (Apple Mail AppleScript doesn't support HTML directly)
     body_text = message if message else (html_to_text(html_message) if html_message else "")
 
-    # Build recipient scripts
-    to_recipients_script = (
-        "\n            ".join(
-            [f'make new to recipient with properties {{address:"{addr}"}}' for addr in recipient_list]
-        )
-        if recipient_list
-        else "-- No TO recipients"
-    )
-
-    cc_recipients_script = (
-        "\n            ".join(
-            [f'make new cc recipient with properties {{address:"{addr}"}}' for addr in (cc_list or [])]
-        )
-        if cc_list
-        else "-- No CC recipients"
-    )
-
-    bcc_recipients_script = (
-        "\n            ".join(
-            [f'make new bcc recipient with properties {{address:"{addr}"}}' for addr in (bcc_list or [])]
-        )
-        if bcc_list
-        else "-- No BCC recipients"
+    result = await applescript_run_compiled(
+        "mail_send_email",
+        SEND_EMAIL_SCRIPT,
+        subject or "",
+        body_text,
+        "\n".join(recipient_list),
+        "\n".join(cc_list or []),
+        "\n".join(bcc_list or []),
+        "true" if compose_only else "false",
     )
 
-    # Determine visibility based on compose_only
-    visible_prop = "true" if compose_only else "false"
-
-    script = f"""
-    tell application "Mail"
-        -- Create new message with specific account
-        set newMessage to make new outgoing message with properties \\
-            {{subject:"{escape_applescript(subject)}", \\
-             content:"{escape_applescript(body_text)}", \\
-             visible:{visible_prop}}}
-
-        -- Add recipients
-        tell newMessage
-            -- Add TO recipients
-            {to_recipients_script}
-
-            -- Add CC recipients
-            {cc_recipients_script}
-
-            -- Add BCC recipients
-            {bcc_recipients_script}
-        end tell
-
-        {"-- Just display the compose window" if compose_only else "-- Send the message"}
-        {"activate" if compose_only else "send newMessage"}
-
-        return "SUCCESS"
-    end tell
-    """
-
-    print(script)
-
-    result = await applescript_run(script)
-
     if "SUCCESS" in result:
         if compose_only:
             return "Email compose window opened successfully. The email is ready for review and manual sending."
@@ -7,6 +7,7 @@ from pyhub.mcptools.apple.utils import (
     applescript_run,
     escape_applescript_string,
     parse_applescript_record,
+    parse_applescript_records,
 )
 
 
@@ -60,16 +61,7 @@ class NotesClient:
         """
 
         result = await applescript_run(script)
-        notes = []
-
-        if result and result != "missing value":
-            for note_data in result.split("<<<NOTE_END>>>"):
-                if note_data.strip():
-                    note_dict = parse_applescript_record(note_data.strip())
-                    if note_dict:
-                        notes.append(note_dict)
-
-        return notes
+        return parse_applescript_records(result, "<<<NOTE_END>>>")
 
     async def search_notes(
         self, search_text: str, folder_name: Optional[str] = None, limit: int = 20
@@ -139,16 +131,7 @@ class NotesClient:
         """
 
         result = await applescript_run(script)
-        notes = []
-
-        if result and result != "missing value":
-            for note_data in result.split("<<<NOTE_END>>>"):
-                if note_data.strip():
-                    note_dict = parse_applescript_record(note_data.strip())
-                    if note_dict:
-                        notes.append(note_dict)
-
-        return notes
+        return parse_applescript_records(result, "<<<NOTE_END>>>")
 
     async def create_note(self, title: str, body: str, folder_name: Optional[str] = None) -> Dict[str, Any]:
         """Create a new note.
@@ -0,0 +1,61 @@
+"""Fixtures for Apple MCP tool tests."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pyhub.mcptools.core.email_types import Email
+
+
+@pytest.fixture
+def mock_applescript(monkeypatch):
+    """Replace module.applescript_run with an AsyncMock built from the given kwargs and return it."""
+
+    def install(module, **kwargs):
+        mock = AsyncMock(**kwargs)
+        monkeypatch.setattr(module, "applescript_run", mock)
+        return mock
+
+    return install
+
+
+@pytest.fixture(scope="session")
+def sample_emails():
+    """Two inbox emails shared by the mail list tests. Treat as read-only."""
+    return (
+        Email(
+            identifier="1",
+            subject="Test Email 1",
+            sender_name="Sender One",
+            sender_email="sender1@example.com",
+            to="recipient@example.com",
+            cc=None,
+            received_at="2024-01-01T10:00:00",
+            body="Test body 1",
+        ),
+        Email(
+            identifier="2",
+            subject="Test Email 2",
+            sender_name="Sender Two",
+            sender_email="sender2@example.com",
+            to="recipient@example.com",
+            cc=None,
+            received_at="2024-01-01T11:00:00",
+            body="Test body 2",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def project_email():
+    """A single email matching the "project" query. Treat as read-only."""
+    return Email(
+        identifier="1",
+        subject="Project Update",
+        sender_name="Project Manager",
+        sender_email="pm@example.com",
+        to="team@example.com",
+        cc=None,
+        received_at="2024-01-01T10:00:00",
+        body="Project status update",
+    )
@@ -0,0 +1,177 @@
+"""Tests for the compiled AppleScript path used by Apple Mail."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from django.conf import settings
+
+from pyhub.mcptools.apple import mail, utils
+from pyhub.mcptools.apple.tools import apple_mail
+from pyhub.mcptools.core.email_types import EmailFolderType
+
+
+@pytest.fixture
+def mock_run_compiled(monkeypatch):
+    """Replace mail.applescript_run_compiled with an AsyncMock that returns no output."""
+    mock = AsyncMock(return_value="")
+    monkeypatch.setattr(mail, "applescript_run_compiled", mock)
+    return mock
+
+
+@pytest.fixture
+def fake_osascript(monkeypatch, tmp_path):
+    """Record osacompile/osascript calls and write the compiled file, caching under tmp_path."""
+    calls = []
+
+    async def exec_osascript(program, *args):
+        calls.append((program, *args))
+        if program == "osacompile":
+            # osacompile -o <output> <source>
+            with open(args[1], "wb") as f:
+                f.write(b"compiled")
+            return ""
+        return "SUCCESS"
+
+    monkeypatch.setattr(settings, "APP_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(utils, "_COMPILED_SCRIPTS", {})
+    monkeypatch.setattr(utils, "_exec_osascript", exec_osascript)
+    return calls
+
+
+@pytest.mark.xdist_group(name="TestMailScriptArgs")
+class TestMailScriptArgs:
+    """Test the argv passed to the compiled Mail scripts."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "kwargs, expected_args",
+        [
+            ({"max_hours": 24}, ("24", "inbox", "", "")),
+            ({"max_hours": 12, "email_folder_type": EmailFolderType.SENT}, ("12", "sent", "", "")),
+            ({"max_hours": 48, "email_folder_name": "Archive"}, ("48", "mailbox", "Archive", "")),
+            ({"max_hours": 24, "query": "project"}, ("24", "inbox", "", "project")),
+        ],
+        ids=["inbox", "sent", "mailbox", "query"],
+    )
+    async def test_get_emails_args(self, mock_run_compiled, kwargs, expected_args):
+        """Test folder kind, mailbox name and query are passed as argv."""
+        await mail.get_emails(**kwargs)
+
+        mock_run_compiled.assert_awaited_once_with("mail_list_emails", mail.LIST_EMAILS_SCRIPT, *expected_args)
+
+    @pytest.mark.asyncio
+    async def test_apple_mail_list_custom_folder_args(self, mock_run_compiled):
+        """Test a folder name other than inbox/sent is passed as a mailbox name."""
+        await apple_mail(operation="list", folder="Archive", query=None, max_hours=6)
+
+        mock_run_compiled.assert_awaited_once_with(
+            "mail_list_emails", mail.LIST_EMAILS_SCRIPT, "6", "mailbox", "Archive", ""
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compose_only, compose_flag", [(False, "false"), (True, "true")], ids=["send", "compose"])
+    async def test_send_email_args(self, mock_run_compiled, compose_only, compose_flag):
+        """Test recipients are newline-joined and compose_only is passed as true/false."""
+        mock_run_compiled.return_value = "SUCCESS"
+
+        await mail.send_email(
+            subject='Say "hi"',
+            message="Line 1\nLine 2",
+            from_email="sender@example.com",
+            recipient_list="a@example.com, b@example.com",
+            cc_list=["c@example.com"],
+            bcc_list=None,
+            compose_only=compose_only,
+        )
+
+        mock_run_compiled.assert_awaited_once_with(
+            "mail_send_email",
+            mail.SEND_EMAIL_SCRIPT,
+            'Say "hi"',
+            "Line 1\nLine 2",
+            "a@example.com\nb@example.com",
+            "c@example.com",
+            "",
+            compose_flag,
+        )
+
+
+@pytest.mark.xdist_group(name="TestCompiledAppleScript")
+class TestCompiledAppleScript:
+    """Test compiling and caching AppleScripts."""
+
+    @pytest.mark.asyncio
+    async def test_compiles_once_and_reuses_path(self, fake_osascript, tmp_path):
+        """Test a second call runs the cached .scpt without recompiling."""
+        assert await utils.applescript_run_compiled("sample", "on run argv\nend run", "a") == "SUCCESS"
+        assert await utils.applescript_run_compiled("sample", "on run argv\nend run", "b") == "SUCCESS"
+
+        programs = [call[0] for call in fake_osascript]
+        assert programs == ["osacompile", "osascript", "osascript"]
+
+        compiled_path = utils._COMPILED_SCRIPTS["sample"]
+        assert compiled_path.parent == tmp_path / "applescript"
+        assert fake_osascript[1] == ("osascript", str(compiled_path), "a")
+        assert fake_osascript[2] == ("osascript", str(compiled_path), "b")
+        # Only the compiled script remains; the temporary source file is removed.
+        assert list(compiled_path.parent.iterdir()) == [compiled_path]
+
+    @pytest.mark.asyncio
+    async def test_reuses_compiled_file_from_earlier_process(self, fake_osascript, monkeypatch):
+        """Test a compiled file already in the cache directory is reused after the in-memory cache is cleared."""
+        await utils.applescript_run_compiled("sample", "on run argv\nend run")
+        monkeypatch.setattr(utils, "_COMPILED_SCRIPTS", {})
+        await utils.applescript_run_compiled("sample", "on run argv\nend run")
+
+        programs = [call[0] for call in fake_osascript]
+        assert programs == ["osacompile", "osascript", "osascript"]
+
+    @pytest.mark.asyncio
+    async def test_changed_source_is_recompiled(self, fake_osascript):
+        """Test a changed script source gets its own compiled file."""
+        await utils.applescript_run_compiled("sample", "on run argv\nend run")
+        first_path = utils._COMPILED_SCRIPTS.pop("sample")
+        await utils.applescript_run_compiled("sample", "on run argv\n-- changed\nend run")
+
+        programs = [call[0] for call in fake_osascript]
+        assert programs == ["osacompile", "osascript", "osacompile", "osascript"]
+        assert utils._COMPILED_SCRIPTS["sample"] != first_path
+
+
+def build_list_output(*subjects: str) -> str:
+    """Build LIST_EMAILS_SCRIPT output for emails with the given subjects."""
+    fields = []
+    for i, subject in enumerate(subjects, 1):
+        fields += [f"Identifier: {i}", f"Subject: {subject}", "SenderName: Sender", "<<<EMAIL_DELIMITER>>>"]
+    return "<<<FIELD_DELIMITER>>>".join(fields)
+
+
+@pytest.mark.xdist_group(name="TestMailListFilter")
+class TestMailListFilter:
+    """Test the whose clause filter of the list script."""
+
+    def test_script_filters_with_whose_clause(self):
+        """Test the list script filters by date and subject in whose clauses read from argv."""
+        script = mail.LIST_EMAILS_SCRIPT
+        assert "set maxHours to (item 1 of argv) as integer" in script
+        assert "set queryText to item 4 of argv" in script
+        assert "whose date received >= thresholdAt)" in script
+        assert "whose date received >= thresholdAt and subject contains queryText)" in script
+
+    @pytest.mark.asyncio
+    async def test_query_and_max_hours_passed_verbatim(self, mock_run_compiled):
+        """Test the query is passed as argv without AppleScript escaping."""
+        await mail.get_emails(max_hours=72, query='He said "hi"\\')
+
+        args = mock_run_compiled.await_args.args
+        assert args[2] == "72"
+        assert args[5] == 'He said "hi"\\'
+
+    @pytest.mark.asyncio
+    async def test_results_are_filtered_by_query(self, mock_run_compiled):
+        """Test emails returned by the script are still filtered by the query, ignoring case."""
+        mock_run_compiled.return_value = build_list_output("Project update", "Lunch")
+
+        emails = await mail.get_emails(max_hours=24, query="PROJECT")
+
+        assert [email.subject for email in emails] == ["Project update"]
@@ -1,60 +1,73 @@
 """Tests for Apple MCP tools."""
 
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
-from pyhub.mcptools.apple import contacts, messages, notes
+from pyhub.mcptools.apple import contacts, mail, messages, notes
 from pyhub.mcptools.apple.tools import apple_contacts, apple_mail, apple_messages, apple_notes
+from pyhub.mcptools.apple.utils import (
+    escape_applescript_string,
+    format_phone_number,
+    parse_applescript_list,
+    parse_applescript_record,
+    parse_applescript_records,
+)
 
 
+def assert_json(result: str, **expected):
+    """Decode a tool's JSON result and assert the given top-level keys."""
+    data = json.loads(result)
+    for key, value in expected.items():
+        assert data.get(key) == value, (key, data)
+    return data
+
+
+@pytest.mark.xdist_group(name="TestMessagesTools")
 class TestMessagesTools:
     """Test Messages integration."""
 
     @pytest.mark.asyncio
-    async def test_send_message_success(self):
+    async def test_send_message_success(self, mock_applescript):
         """Test successful message sending."""
-        with patch("pyhub.mcptools.apple.messages.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "SUCCESS"
+        mock_run = mock_applescript(messages, return_value="SUCCESS")
 
-            result = await messages.send_message("+1234567890", "Test message")
+        result = await messages.send_message("+1234567890", "Test message")
 
-            assert result["status"] == "success"
-            assert result["phone_number"] == "+1234567890"
-            assert result["message"] == "Test message"
-            assert result["service"] == "iMessage"
-            assert "timestamp" in result
-            assert mock_run.called
+        assert result["status"] == "success"
+        assert result["phone_number"] == "+1234567890"
+        assert result["message"] == "Test message"
+        assert result["service"] == "iMessage"
+        assert "timestamp" in result
+        assert mock_run.called
 
     @pytest.mark.asyncio
-    async def test_send_message_error(self):
+    async def test_send_message_error(self, mock_applescript):
         """Test message sending with error."""
-        with patch("pyhub.mcptools.apple.messages.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.side_effect = Exception("AppleScript error")
+        mock_applescript(messages, side_effect=Exception("AppleScript error"))
 
-            result = await messages.send_message("+1234567890", "Test message")
+        result = await messages.send_message("+1234567890", "Test message")
 
-            assert result["status"] == "error"
-            assert "AppleScript error" in result["error"]
-            assert result["phone_number"] == "+1234567890"
+        assert result["status"] == "error"
+        assert "AppleScript error" in result["error"]
+        assert result["phone_number"] == "+1234567890"
 
     @pytest.mark.asyncio
-    async def test_schedule_message_success(self):
+    async def test_schedule_message_success(self, mock_applescript):
         """Test successful message scheduling."""
-        with patch("pyhub.mcptools.apple.messages.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "SUCCESS"
+        mock_applescript(messages, return_value="SUCCESS")
 
-            client = messages.MessagesClient()
-            result = await client.schedule_message("+1234567890", "Scheduled message", "2025-05-30T17:00:00+09:00")
+        client = messages.MessagesClient()
+        result = await client.schedule_message("+1234567890", "Scheduled message", "2025-05-30T17:00:00+09:00")
 
-            assert result["status"] == "scheduled"
-            assert result["phone_number"] == "+1234567890"
-            assert result["message"] == "Scheduled message"
-            assert result["scheduled_time"] == "2025-05-30T17:00:00+09:00"
-            assert result["reminder_created"] is True
-            assert "warning" in result
-            assert "timezone" in result["warning"]
+        assert result["status"] == "scheduled"
+        assert result["phone_number"] == "+1234567890"
+        assert result["message"] == "Scheduled message"
+        assert result["scheduled_time"] == "2025-05-30T17:00:00+09:00"
+        assert result["reminder_created"] is True
+        assert "warning" in result
+        assert "timezone" in result["warning"]
 
     @pytest.mark.asyncio
     async def test_schedule_message_invalid_time(self):
@@ -66,37 +79,69 @@ class TestMessagesTools:
         assert "Invalid scheduled_time format" in result["error"]
 
     @pytest.mark.asyncio
-    async def test_get_unread_count(self):
+    async def test_get_unread_count(self, mock_applescript):
         """Test getting unread message count."""
-        with patch("pyhub.mcptools.apple.messages.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "5"
+        mock_run = mock_applescript(messages, return_value="5")
 
-            count = await messages.get_unread_count()
+        count = await messages.get_unread_count()
 
-            assert count == 5
-            assert mock_run.called
+        assert count == 5
+        assert mock_run.called
 
     @pytest.mark.asyncio
-    async def test_get_unread_count_invalid_response(self):
+    async def test_get_unread_count_invalid_response(self, mock_applescript):
         """Test getting unread count with invalid response."""
-        with patch("pyhub.mcptools.apple.messages.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "invalid"
+        mock_applescript(messages, return_value="invalid")
 
-            count = await messages.get_unread_count()
+        count = await messages.get_unread_count()
 
-            assert count == 0
+        assert count == 0
 
     @pytest.mark.asyncio
-    async def test_apple_messages_tool_send(self):
-        """Test apple_messages MCP tool for sending."""
-        with patch("pyhub.mcptools.apple.messages.send_message", new_callable=AsyncMock) as mock_send:
-            mock_send.return_value = {"status": "success"}
+    @pytest.mark.parametrize(
+        "kwargs, target, return_value, expected, call_args",
+        [
+            (
+                {"operation": "send", "phone_number": "+1234567890", "message": "Test", "service": "SMS"},
+                (messages, "send_message"),
+                {"status": "success"},
+                {"status": "success"},
+                ("+1234567890", "Test", "SMS"),
+            ),
+            (
+                {
+                    "operation": "schedule",
+                    "phone_number": "+1234567890",
+                    "message": "Test",
+                    "scheduled_time": "2025-05-30T17:00:00+09:00",
+                },
+                (messages.MessagesClient, "schedule_message"),
+                {"status": "scheduled"},
+                {"status": "scheduled"},
+                None,
+            ),
+            (
+                {"operation": "unread"},
+                (messages, "get_unread_count"),
+                10,
+                {"unread_count": 10},
+                None,
+            ),
+        ],
+        ids=["send", "schedule", "unread"],
+    )
+    async def test_apple_messages_tool_operation(self, monkeypatch, kwargs, target, return_value, expected, call_args):
+        """Test apple_messages MCP tool dispatching to each operation."""
+        mock_operation = AsyncMock(return_value=return_value)
+        monkeypatch.setattr(*target, mock_operation)
 
-            result = await apple_messages(operation="send", phone_number="+1234567890", message="Test", service="SMS")
+        result = await apple_messages(**kwargs)
 
-            data = json.loads(result)
-            assert data["status"] == "success"
-            mock_send.assert_called_once_with("+1234567890", "Test", "SMS")
+        data = json.loads(result)
+        assert data == expected
+        mock_operation.assert_awaited_once()
+        if call_args is not None:
+            mock_operation.assert_called_once_with(*call_args)
 
     @pytest.mark.asyncio
     async def test_apple_messages_tool_send_missing_params(self):
@@ -106,37 +151,7 @@ class TestMessagesTools:
         # For now, we'll test with None values
         result = await apple_messages(operation="send", phone_number="+1234567890", message=None)
 
-        data = json.loads(result)
-        assert data["error"] == "phone_number and message are required for send operation"
-
-    @pytest.mark.asyncio
-    async def test_apple_messages_tool_schedule(self):
-        """Test apple_messages MCP tool for scheduling."""
-        with patch(
-            "pyhub.mcptools.apple.messages.MessagesClient.schedule_message", new_callable=AsyncMock
-        ) as mock_schedule:
-            mock_schedule.return_value = {"status": "scheduled"}
-
-            result = await apple_messages(
-                operation="schedule",
-                phone_number="+1234567890",
-                message="Test",
-                scheduled_time="2025-05-30T17:00:00+09:00",
-            )
-
-            data = json.loads(result)
-            assert data["status"] == "scheduled"
-
-    @pytest.mark.asyncio
-    async def test_apple_messages_tool_unread(self):
-        """Test apple_messages MCP tool for unread count."""
-        with patch("pyhub.mcptools.apple.messages.get_unread_count", new_callable=AsyncMock) as mock_unread:
-            mock_unread.return_value = 10
-
-            result = await apple_messages(operation="unread")
-
-            data = json.loads(result)
-            assert data["unread_count"] == 10
+        assert_json(result, error="phone_number and message are required for send operation")
 
     @pytest.mark.asyncio
     async def test_apple_messages_tool_unknown_operation(self):
@@ -147,35 +162,34 @@ class TestMessagesTools:
         assert "Unknown operation" in data["error"]
 
 
+@pytest.mark.xdist_group(name="TestNotesTools")
 class TestNotesTools:
     """Test Notes integration."""
 
     @pytest.mark.asyncio
-    async def test_create_note_success(self):
+    async def test_create_note_success(self, mock_applescript):
         """Test creating a note successfully."""
-        with patch("pyhub.mcptools.apple.notes.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "ID:::note123|||Name:::Test Note"
+        mock_applescript(notes, return_value="ID:::note123|||Name:::Test Note")
 
-            result = await notes.create_note("Test Note", "Test content", "Work")
+        result = await notes.create_note("Test Note", "Test content", "Work")
 
-            assert result["status"] == "success"
-            assert result["note_id"] == "note123"
-            assert result["title"] == "Test Note"
-            assert result["folder"] == "Work"
+        assert result["status"] == "success"
+        assert result["note_id"] == "note123"
+        assert result["title"] == "Test Note"
+        assert result["folder"] == "Work"
 
     @pytest.mark.asyncio
-    async def test_create_note_error(self):
+    async def test_create_note_error(self, mock_applescript):
         """Test creating a note with error."""
-        with patch("pyhub.mcptools.apple.notes.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.side_effect = Exception("AppleScript error")
+        mock_applescript(notes, side_effect=Exception("AppleScript error"))
 
-            result = await notes.create_note("Test", "Content")
+        result = await notes.create_note("Test", "Content")
 
-            assert result["status"] == "error"
-            assert "AppleScript error" in result["error"]
+        assert result["status"] == "error"
+        assert "AppleScript error" in result["error"]
 
     @pytest.mark.asyncio
-    async def test_list_notes(self):
+    async def test_list_notes(self, mock_applescript):
         """Test listing notes."""
         mock_output = (
             "ID:::note1|||Name:::Note 1|||Body:::Content 1|||"
@@ -186,144 +200,134 @@ class TestNotesTools:
             "Folder:::Work<<<NOTE_END>>>"
         )
 
-        with patch("pyhub.mcptools.apple.notes.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = mock_output
+        mock_applescript(notes, return_value=mock_output)
 
-            result = await notes.list_notes(folder_name="Work", limit=10)
+        result = await notes.list_notes(folder_name="Work", limit=10)
 
-            assert len(result) == 2
-            assert result[0]["ID"] == "note1"
-            assert result[0]["Name"] == "Note 1"
-            assert result[1]["ID"] == "note2"
-            assert result[1]["Folder"] == "Work"
+        assert len(result) == 2
+        assert result[0]["ID"] == "note1"
+        assert result[0]["Name"] == "Note 1"
+        assert result[1]["ID"] == "note2"
+        assert result[1]["Folder"] == "Work"
 
     @pytest.mark.asyncio
-    async def test_search_notes(self):
+    async def test_search_notes(self, mock_applescript):
         """Test searching notes."""
         mock_output = """ID:::note1|||Name:::Meeting Notes|||Body:::Today's meeting agenda<<<NOTE_END>>>"""
 
-        with patch("pyhub.mcptools.apple.notes.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = mock_output
+        mock_applescript(notes, return_value=mock_output)
 
-            result = await notes.search_notes("meeting", limit=5)
+        result = await notes.search_notes("meeting", limit=5)
 
-            assert len(result) == 1
-            assert result[0]["Name"] == "Meeting Notes"
-            assert "meeting agenda" in result[0]["Body"]
+        assert len(result) == 1
+        assert result[0]["Name"] == "Meeting Notes"
+        assert "meeting agenda" in result[0]["Body"]
 
     @pytest.mark.asyncio
-    async def test_get_note_found(self):
+    async def test_get_note_found(self, mock_applescript):
         """Test getting a specific note."""
-        with patch("pyhub.mcptools.apple.notes.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "ID:::note123|||Name:::Test Note|||Body:::Content|||Folder:::Notes"
+        mock_applescript(notes, return_value="ID:::note123|||Name:::Test Note|||Body:::Content|||Folder:::Notes")
 
-            result = await notes.get_note("note123")
+        result = await notes.get_note("note123")
 
-            assert result["ID"] == "note123"
-            assert result["Name"] == "Test Note"
+        assert result["ID"] == "note123"
+        assert result["Name"] == "Test Note"
 
     @pytest.mark.asyncio
-    async def test_get_note_not_found(self):
+    async def test_get_note_not_found(self, mock_applescript):
         """Test getting a non-existent note."""
-        with patch("pyhub.mcptools.apple.notes.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "NOT_FOUND"
+        mock_applescript(notes, return_value="NOT_FOUND")
 
-            result = await notes.get_note("invalid")
+        result = await notes.get_note("invalid")
 
-            assert result is None
+        assert result is None
 
     @pytest.mark.asyncio
-    async def test_list_folders(self):
+    async def test_list_folders(self, mock_applescript):
         """Test listing folders."""
-        with patch("pyhub.mcptools.apple.notes.applescript_run", new_callable=AsyncMock) as mock_run:
-            # The actual implementation returns folders separated by |||
-            mock_run.return_value = "Notes|||Work|||Personal|||Archive"
+        # The actual implementation returns folders separated by |||
+        mock_applescript(notes, return_value="Notes|||Work|||Personal|||Archive")
 
-            result = await notes.list_folders()
+        result = await notes.list_folders()
 
-            assert len(result) == 4
-            assert "Notes" in result
-            assert "Work" in result
+        assert len(result) == 4
+        assert "Notes" in result
+        assert "Work" in result
 
     @pytest.mark.asyncio
-    async def test_apple_notes_tool_list(self):
-        """Test apple_notes MCP tool for listing."""
-        with patch("pyhub.mcptools.apple.notes.list_notes", new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = [{"ID": "1", "Name": "Test"}]
+    @pytest.mark.parametrize(
+        "kwargs, target, return_value, expected",
+        [
+            (
+                {"operation": "list", "folder_name": "Work", "limit": 10},
+                (notes, "list_notes"),
+                [{"ID": "1", "Name": "Test"}],
+                [{"ID": "1", "Name": "Test"}],
+            ),
+            (
+                {"operation": "create", "title": "Test", "body": "Content", "folder_name": "Work"},
+                (notes, "create_note"),
+                {"status": "success", "note_id": "123"},
+                {"status": "success", "note_id": "123"},
+            ),
+            (
+                {"operation": "get", "note_id": "123"},
+                (notes, "get_note"),
+                {"ID": "123", "Name": "Test"},
+                {"ID": "123", "Name": "Test"},
+            ),
+            (
+                {"operation": "folders"},
+                (notes, "list_folders"),
+                ["Notes", "Work"],
+                {"folders": ["Notes", "Work"]},
+            ),
+        ],
+        ids=["list", "create", "get", "folders"],
+    )
+    async def test_apple_notes_tool_operation(self, monkeypatch, kwargs, target, return_value, expected):
+        """Test apple_notes MCP tool dispatching to each operation."""
+        mock_operation = AsyncMock(return_value=return_value)
+        monkeypatch.setattr(*target, mock_operation)
 
-            result = await apple_notes(operation="list", folder_name="Work", limit=10)
+        result = await apple_notes(**kwargs)
 
-            data = json.loads(result)
-            assert len(data) == 1
-            assert data[0]["Name"] == "Test"
+        data = json.loads(result)
+        assert data == expected
+        mock_operation.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_apple_notes_tool_search_missing_text(self):
         """Test apple_notes search without search text."""
         result = await apple_notes(operation="search", search_text=None)
 
-        data = json.loads(result)
-        assert data["error"] == "search_text is required for search operation"
-
-    @pytest.mark.asyncio
-    async def test_apple_notes_tool_create(self):
-        """Test apple_notes MCP tool for creating."""
-        with patch("pyhub.mcptools.apple.notes.create_note", new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = {"status": "success", "note_id": "123"}
-
-            result = await apple_notes(operation="create", title="Test", body="Content", folder_name="Work")
-
-            data = json.loads(result)
-            assert data["status"] == "success"
-            assert data["note_id"] == "123"
-
-    @pytest.mark.asyncio
-    async def test_apple_notes_tool_get(self):
-        """Test apple_notes MCP tool for getting a note."""
-        with patch("pyhub.mcptools.apple.notes.get_note", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = {"ID": "123", "Name": "Test"}
-
-            result = await apple_notes(operation="get", note_id="123")
-
-            data = json.loads(result)
-            assert data["ID"] == "123"
-
-    @pytest.mark.asyncio
-    async def test_apple_notes_tool_folders(self):
-        """Test apple_notes MCP tool for listing folders."""
-        with patch("pyhub.mcptools.apple.notes.list_folders", new_callable=AsyncMock) as mock_folders:
-            mock_folders.return_value = ["Notes", "Work"]
-
-            result = await apple_notes(operation="folders")
-
-            data = json.loads(result)
-            assert data["folders"] == ["Notes", "Work"]
+        assert_json(result, error="search_text is required for search operation")
 
 
+@pytest.mark.xdist_group(name="TestContactsTools")
 class TestContactsTools:
     """Test Contacts integration."""
 
     @pytest.mark.asyncio
-    async def test_search_contacts_by_name(self):
+    async def test_search_contacts_by_name(self, mock_applescript):
         """Test searching contacts by name."""
         mock_output = (
             "ID:::contact1|||Name:::John Doe|||Emails:::john@example.com|||"
             "Phones:::+1234567890|||Organization:::ACME<<<CONTACT_END>>>"
         )
 
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = mock_output
+        mock_applescript(contacts, return_value=mock_output)
 
-            result = await contacts.search_contacts(name="John", limit=10)
+        result = await contacts.search_contacts(name="John", limit=10)
 
-            assert len(result) == 1
-            assert result[0]["ID"] == "contact1"
-            assert result[0]["Name"] == "John Doe"
-            assert result[0]["Emails"] == ["john@example.com"]
-            assert result[0]["Phones"] == ["+1234567890"]
+        assert len(result) == 1
+        assert result[0]["ID"] == "contact1"
+        assert result[0]["Name"] == "John Doe"
+        assert result[0]["Emails"] == ["john@example.com"]
+        assert result[0]["Phones"] == ["+1234567890"]
 
     @pytest.mark.asyncio
-    async def test_search_contacts_by_email(self):
+    async def test_search_contacts_by_email(self, mock_applescript):
         """Test searching contacts by email."""
         mock_output = (
             "ID:::contact2|||Name:::Jane Smith|||"
@@ -331,27 +335,25 @@ class TestContactsTools:
             "Phones:::<<<CONTACT_END>>>"
         )
 
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = mock_output
+        mock_applescript(contacts, return_value=mock_output)
 
-            result = await contacts.search_contacts(email="jane@example.com")
+        result = await contacts.search_contacts(email="jane@example.com")
 
-            assert len(result) == 1
-            assert result[0]["Emails"] == ["jane@example.com", "jane.work@example.com"]
-            assert result[0]["Phones"] == []
+        assert len(result) == 1
+        assert result[0]["Emails"] == ["jane@example.com", "jane.work@example.com"]
+        assert result[0]["Phones"] == []
 
     @pytest.mark.asyncio
-    async def test_search_contacts_no_results(self):
+    async def test_search_contacts_no_results(self, mock_applescript):
         """Test searching contacts with no results."""
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = ""
+        mock_applescript(contacts, return_value="")
 
-            result = await contacts.search_contacts(name="Nobody")
+        result = await contacts.search_contacts(name="Nobody")
 
-            assert result == []
+        assert result == []
 
     @pytest.mark.asyncio
-    async def test_get_contact_found(self):
+    async def test_get_contact_found(self, mock_applescript):
         """Test getting a specific contact."""
         mock_output = (
             "ID:::contact123|||Name:::John Doe|||Emails:::john@example.com|||"
@@ -360,132 +362,130 @@ class TestContactsTools:
             "Note:::Important client"
         )
 
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = mock_output
+        mock_applescript(contacts, return_value=mock_output)
 
-            result = await contacts.get_contact("contact123")
+        result = await contacts.get_contact("contact123")
 
-            assert result["ID"] == "contact123"
-            assert result["Name"] == "John Doe"
-            assert result["Organization"] == "ACME Corp"
-            assert "Important client" in result["Note"]
+        assert result["ID"] == "contact123"
+        assert result["Name"] == "John Doe"
+        assert result["Organization"] == "ACME Corp"
+        assert "Important client" in result["Note"]
 
     @pytest.mark.asyncio
-    async def test_get_contact_not_found(self):
+    async def test_get_contact_not_found(self, mock_applescript):
         """Test getting a non-existent contact."""
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "NOT_FOUND"
+        mock_applescript(contacts, return_value="NOT_FOUND")
 
-            result = await contacts.get_contact("invalid")
+        result = await contacts.get_contact("invalid")
 
-            assert result is None
+        assert result is None
 
     @pytest.mark.asyncio
-    async def test_create_contact_success(self):
+    async def test_create_contact_success(self, mock_applescript):
         """Test creating a contact successfully."""
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "ID:::newcontact123"
-
-            result = await contacts.create_contact(
-                "John",
-                "Doe",
-                email="john@example.com",
-                phone="+1234567890",
-                organization="ACME Corp",
-                note="VIP client",
-            )
+        mock_applescript(contacts, return_value="ID:::newcontact123")
+
+        result = await contacts.create_contact(
+            "John",
+            "Doe",
+            email="john@example.com",
+            phone="+1234567890",
+            organization="ACME Corp",
+            note="VIP client",
+        )
 
-            assert result["status"] == "success"
-            assert result["contact_id"] == "newcontact123"
-            assert result["first_name"] == "John"
-            assert result["last_name"] == "Doe"
+        assert result["status"] == "success"
+        assert result["contact_id"] == "newcontact123"
+        assert result["first_name"] == "John"
+        assert result["last_name"] == "Doe"
 
     @pytest.mark.asyncio
-    async def test_create_contact_minimal(self):
+    async def test_create_contact_minimal(self, mock_applescript):
         """Test creating a contact with minimal info."""
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "ID:::contact456"
+        mock_applescript(contacts, return_value="ID:::contact456")
 
-            result = await contacts.create_contact("Jane")
+        result = await contacts.create_contact("Jane")
 
-            assert result["status"] == "success"
-            assert result["contact_id"] == "contact456"
-            assert result["first_name"] == "Jane"
-            assert result["last_name"] is None
+        assert result["status"] == "success"
+        assert result["contact_id"] == "contact456"
+        assert result["first_name"] == "Jane"
+        assert result["last_name"] is None
 
     @pytest.mark.asyncio
-    async def test_create_contact_error(self):
+    async def test_create_contact_error(self, mock_applescript):
         """Test creating a contact with error."""
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.side_effect = Exception("AppleScript error")
+        mock_applescript(contacts, side_effect=Exception("AppleScript error"))
 
-            result = await contacts.create_contact("Test")
+        result = await contacts.create_contact("Test")
 
-            assert result["status"] == "error"
-            assert "AppleScript error" in result["error"]
+        assert result["status"] == "error"
+        assert "AppleScript error" in result["error"]
 
     @pytest.mark.asyncio
-    async def test_apple_contacts_tool_search(self):
-        """Test apple_contacts MCP tool for searching."""
-        with patch("pyhub.mcptools.apple.contacts.search_contacts", new_callable=AsyncMock) as mock_search:
-            mock_search.return_value = [{"ID": "1", "Name": "Test"}]
+    @pytest.mark.parametrize(
+        "kwargs, target, return_value, expected",
+        [
+            (
+                {"operation": "search", "name": "Test", "limit": 5},
+                (contacts, "search_contacts"),
+                [{"ID": "1", "Name": "Test"}],
+                [{"ID": "1", "Name": "Test"}],
+            ),
+            (
+                {"operation": "create", "first_name": "John", "last_name": "Doe", "email": "john@example.com"},
+                (contacts, "create_contact"),
+                {"status": "success", "contact_id": "123"},
+                {"status": "success", "contact_id": "123"},
+            ),
+        ],
+        ids=["search", "create"],
+    )
+    async def test_apple_contacts_tool_operation(self, monkeypatch, kwargs, target, return_value, expected):
+        """Test apple_contacts MCP tool dispatching to each operation."""
+        mock_operation = AsyncMock(return_value=return_value)
+        monkeypatch.setattr(*target, mock_operation)
 
-            result = await apple_contacts(operation="search", name="Test", limit=5)
+        result = await apple_contacts(**kwargs)
 
-            data = json.loads(result)
-            assert len(data) == 1
-            assert data[0]["Name"] == "Test"
+        data = json.loads(result)
+        assert data == expected
+        mock_operation.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_apple_contacts_tool_get_missing_id(self):
         """Test apple_contacts get without contact_id."""
         result = await apple_contacts(operation="get", contact_id=None)
 
-        data = json.loads(result)
-        assert data["error"] == "contact_id is required for get operation"
+        assert_json(result, error="contact_id is required for get operation")
 
     @pytest.mark.asyncio
     async def test_apple_contacts_tool_create_missing_name(self):
         """Test apple_contacts create without first_name."""
         result = await apple_contacts(operation="create", first_name=None)
 
-        data = json.loads(result)
-        assert data["error"] == "first_name is required for create operation"
-
-    @pytest.mark.asyncio
-    async def test_apple_contacts_tool_create_success(self):
-        """Test apple_contacts MCP tool for creating."""
-        with patch("pyhub.mcptools.apple.contacts.create_contact", new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = {"status": "success", "contact_id": "123"}
-
-            result = await apple_contacts(
-                operation="create", first_name="John", last_name="Doe", email="john@example.com"
-            )
-
-            data = json.loads(result)
-            assert data["status"] == "success"
-            assert data["contact_id"] == "123"
+        assert_json(result, error="first_name is required for create operation")
 
 
+@pytest.mark.xdist_group(name="TestMailTools")
 class TestMailTools:
     """Test Mail integration."""
 
     @pytest.mark.asyncio
-    async def test_apple_mail_send_success(self):
+    async def test_apple_mail_send_success(self, monkeypatch):
         """Test sending email successfully."""
-        with patch("pyhub.mcptools.apple.mail.send_email", new_callable=AsyncMock) as mock_send:
-            mock_send.return_value = "Email sent successfully"
+        mock_operation = AsyncMock(return_value="Email sent successfully")
+        monkeypatch.setattr(mail, "send_email", mock_operation)
 
-            result = await apple_mail(
-                operation="send",
-                subject="Test Subject",
-                message="Test message",
-                from_email="sender@example.com",
-                recipient_list="recipient@example.com",
-            )
+        result = await apple_mail(
+            operation="send",
+            subject="Test Subject",
+            message="Test message",
+            from_email="sender@example.com",
+            recipient_list="recipient@example.com",
+        )
 
-            assert result == "Email sent successfully"
-            mock_send.assert_called_once()
+        assert result == "Email sent successfully"
+        mock_operation.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_apple_mail_send_missing_params(self):
@@ -503,69 +503,29 @@ class TestMailTools:
         assert "required for send operation" in data["error"]
 
     @pytest.mark.asyncio
-    async def test_apple_mail_list_emails(self):
+    async def test_apple_mail_list_emails(self, monkeypatch, sample_emails):
         """Test listing emails."""
-        from pyhub.mcptools.core.email_types import Email
-
-        mock_emails = [
-            Email(
-                identifier="1",
-                subject="Test Email 1",
-                sender_name="Sender One",
-                sender_email="sender1@example.com",
-                to="recipient@example.com",
-                cc=None,
-                received_at="2024-01-01T10:00:00",
-                body="Test body 1",
-            ),
-            Email(
-                identifier="2",
-                subject="Test Email 2",
-                sender_name="Sender Two",
-                sender_email="sender2@example.com",
-                to="recipient@example.com",
-                cc=None,
-                received_at="2024-01-01T11:00:00",
-                body="Test body 2",
-            ),
-        ]
+        mock_operation = AsyncMock(return_value=list(sample_emails))
+        monkeypatch.setattr(mail, "get_emails", mock_operation)
 
-        with patch("pyhub.mcptools.apple.mail.get_emails", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_emails
+        result = await apple_mail(operation="list", folder="inbox", max_hours=24)
 
-            result = await apple_mail(operation="list", folder="inbox", max_hours=24)
-
-            data = json.loads(result)
-            assert len(data) == 2
-            assert data[0]["subject"] == "Test Email 1"
-            assert data[1]["subject"] == "Test Email 2"
+        data = json.loads(result)
+        assert len(data) == 2
+        assert data[0]["subject"] == "Test Email 1"
+        assert data[1]["subject"] == "Test Email 2"
 
     @pytest.mark.asyncio
-    async def test_apple_mail_list_with_query(self):
+    async def test_apple_mail_list_with_query(self, monkeypatch, project_email):
         """Test listing emails with search query."""
-        from pyhub.mcptools.core.email_types import Email
-
-        mock_emails = [
-            Email(
-                identifier="1",
-                subject="Project Update",
-                sender_name="Project Manager",
-                sender_email="pm@example.com",
-                to="team@example.com",
-                cc=None,
-                received_at="2024-01-01T10:00:00",
-                body="Project status update",
-            )
-        ]
+        mock_operation = AsyncMock(return_value=[project_email])
+        monkeypatch.setattr(mail, "get_emails", mock_operation)
 
-        with patch("pyhub.mcptools.apple.mail.get_emails", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_emails
+        result = await apple_mail(operation="list", folder="inbox", query="project", max_hours=48)
 
-            result = await apple_mail(operation="list", folder="inbox", query="project", max_hours=48)
-
-            data = json.loads(result)
-            assert len(data) == 1
-            assert "Project" in data[0]["subject"]
+        data = json.loads(result)
+        assert len(data) == 1
+        assert "Project" in data[0]["subject"]
 
     @pytest.mark.asyncio
     async def test_apple_mail_unknown_operation(self):
@@ -576,182 +536,218 @@ class TestMailTools:
         assert "Unknown operation" in data["error"]
 
 
+@pytest.mark.xdist_group(name="TestAppleUtils")
 class TestAppleUtils:
     """Test Apple utility functions."""
 
-    def test_escape_applescript_string(self):
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("", ""),
+            ("simple", "simple"),
+            ('with "quotes"', 'with \\"quotes\\"'),
+            ("line1\nline2", "line1\\nline2"),
+            ("back\\slash", "back\\\\slash"),
+        ],
+    )
+    def test_escape_applescript_string(self, raw, expected):
         """Test AppleScript string escaping."""
-        from pyhub.mcptools.apple.utils import escape_applescript_string
-
-        assert escape_applescript_string("") == ""
-        assert escape_applescript_string("simple") == "simple"
-        assert escape_applescript_string('with "quotes"') == 'with \\"quotes\\"'
-        assert escape_applescript_string("line1\nline2") == "line1\\nline2"
-        assert escape_applescript_string("back\\slash") == "back\\\\slash"
-
-    def test_format_phone_number(self):
+        assert escape_applescript_string(raw) == expected
+
+    # The actual implementation:
+    # - Removes all non-digit characters (including +)
+    # - Adds US country code '1' to 10-digit numbers
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("+1234567890", "11234567890"),  # + removed, 1 added to 10 digits
+            ("01012345678", "01012345678"),  # No country code added for 11 digits
+            ("1234567890", "11234567890"),  # US country code added for 10 digits
+            ("(123) 456-7890", "11234567890"),  # Special chars removed, 1 added
+        ],
+    )
+    def test_format_phone_number(self, raw, expected):
         """Test phone number formatting."""
-        from pyhub.mcptools.apple.utils import format_phone_number
-
-        # The actual implementation:
-        # - Removes all non-digit characters (including +)
-        # - Adds US country code '1' to 10-digit numbers
-        assert format_phone_number("+1234567890") == "11234567890"  # + removed, 1 added to 10 digits
-        assert format_phone_number("01012345678") == "01012345678"  # No country code added for 11 digits
-        assert format_phone_number("1234567890") == "11234567890"  # US country code added for 10 digits
-        assert format_phone_number("(123) 456-7890") == "11234567890"  # Special chars removed, 1 added
-
-    def test_parse_applescript_record(self):
+        assert format_phone_number(raw) == expected
+
+    @pytest.mark.parametrize(
+        "record, expected",
+        [
+            (
+                "Key1:::Value1|||Key2:::Value2|||Key3:::Value3",
+                {"Key1": "Value1", "Key2": "Value2", "Key3": "Value3"},
+            ),
+            # The actual implementation doesn't convert "missing value" to ""
+            (
+                "Key1:::missing value|||Key2:::Value2",
+                {"Key1": "missing value", "Key2": "Value2"},
+            ),
+        ],
+    )
+    def test_parse_applescript_record(self, record, expected):
         """Test parsing AppleScript record format."""
-        from pyhub.mcptools.apple.utils import parse_applescript_record
-
-        record = "Key1:::Value1|||Key2:::Value2|||Key3:::Value3"
         parsed = parse_applescript_record(record)
 
-        assert parsed["Key1"] == "Value1"
-        assert parsed["Key2"] == "Value2"
-        assert parsed["Key3"] == "Value3"
-
-        # Test with missing value - the actual implementation doesn't convert "missing value" to ""
-        record_missing = "Key1:::missing value|||Key2:::Value2"
-        parsed_missing = parse_applescript_record(record_missing)
-
-        assert parsed_missing["Key1"] == "missing value"  # Actual behavior
-        assert parsed_missing["Key2"] == "Value2"
+        for key, value in expected.items():
+            assert parsed[key] == value
 
-    def test_parse_applescript_list(self):
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            (
+                "ID:::1|||Name:::One<<<END>>>\nID:::2|||Name:::Two<<<END>>>",
+                [{"ID": "1", "Name": "One"}, {"ID": "2", "Name": "Two"}],
+            ),
+            ("ID:::1|||Name:::One", [{"ID": "1", "Name": "One"}]),
+            ("<<<END>>>", []),
+            ("", []),
+            ("missing value", []),
+        ],
+    )
+    def test_parse_applescript_records(self, raw, expected):
+        """Test parsing delimiter-separated AppleScript records."""
+        assert parse_applescript_records(raw, "<<<END>>>") == expected
+
+    # The actual implementation splits by ||| delimiter
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("item1|||item2|||item3", ["item1", "item2", "item3"]),
+            ("", []),
+            ("missing value", []),
+        ],
+    )
+    def test_parse_applescript_list(self, raw, expected):
         """Test parsing AppleScript list format."""
-        from pyhub.mcptools.apple.utils import parse_applescript_list
-
-        # The actual implementation splits by ||| delimiter
-        lst = "item1|||item2|||item3"
-        parsed = parse_applescript_list(lst)
-
-        assert parsed == ["item1", "item2", "item3"]
-
-        # Test empty string
-        assert parse_applescript_list("") == []
-
-        # Test missing value
-        assert parse_applescript_list("missing value") == []
+        assert parse_applescript_list(raw) == expected
 
 
+@pytest.mark.xdist_group(name="TestEdgeCases")
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
     @pytest.mark.asyncio
-    async def test_messages_special_characters(self):
+    async def test_messages_special_characters(self, mock_applescript):
         """Test sending message with special characters."""
-        with patch("pyhub.mcptools.apple.messages.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = "SUCCESS"
+        mock_run = mock_applescript(messages, return_value="SUCCESS")
 
-            result = await messages.send_message("+1234567890", 'Message with "quotes" and \nnewline')
+        result = await messages.send_message("+1234567890", 'Message with "quotes" and \nnewline')
 
-            assert result["status"] == "success"
-            # Check that the message was properly escaped in the AppleScript
-            call_args = mock_run.call_args[0][0]
-            assert '\\"quotes\\"' in call_args
-            assert "\\n" in call_args
+        assert result["status"] == "success"
+        # Check that the message was properly escaped in the AppleScript
+        call_args = mock_run.call_args[0][0]
+        assert '\\"quotes\\"' in call_args
+        assert "\\n" in call_args
 
     @pytest.mark.asyncio
-    async def test_notes_empty_response(self):
+    async def test_notes_empty_response(self, mock_applescript):
         """Test handling empty response from Notes."""
-        with patch("pyhub.mcptools.apple.notes.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = ""
+        mock_applescript(notes, return_value="")
 
-            result = await notes.list_notes()
+        result = await notes.list_notes()
 
-            assert result == []
+        assert result == []
 
     @pytest.mark.asyncio
-    async def test_contacts_missing_value_handling(self):
+    async def test_contacts_missing_value_handling(self, mock_applescript):
         """Test handling 'missing value' in contact fields."""
         mock_output = (
             "ID:::contact1|||Name:::John|||Emails:::missing value|||"
             "Phones:::missing value|||Organization:::missing value<<<CONTACT_END>>>"
         )
 
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = mock_output
+        mock_applescript(contacts, return_value=mock_output)
 
-            result = await contacts.search_contacts(name="John")
+        result = await contacts.search_contacts(name="John")
 
-            assert len(result) == 1
-            assert result[0]["Name"] == "John"
-            # The implementation splits "missing value" as a single item in the list
-            assert result[0]["Emails"] == ["missing value"]
-            assert result[0]["Phones"] == ["missing value"]
-            assert result[0]["Organization"] == "missing value"
+        assert len(result) == 1
+        assert result[0]["Name"] == "John"
+        # The implementation splits "missing value" as a single item in the list
+        assert result[0]["Emails"] == ["missing value"]
+        assert result[0]["Phones"] == ["missing value"]
+        assert result[0]["Organization"] == "missing value"
 
 
+@pytest.mark.xdist_group(name="TestIntegrationScenarios")
 class TestIntegrationScenarios:
     """Test realistic integration scenarios."""
 
     @pytest.mark.asyncio
-    async def test_complete_workflow_messages(self):
-        """Test complete Messages workflow."""
-        with patch("pyhub.mcptools.apple.messages.applescript_run", new_callable=AsyncMock) as mock_run:
-            # First, check unread count
-            mock_run.return_value = "3"
-            unread_before = await messages.get_unread_count()
-            assert unread_before == 3
-
-            # Send a message
-            mock_run.return_value = "SUCCESS"
-            send_result = await messages.send_message("+1234567890", "Hello!")
-            assert send_result["status"] == "success"
-
-            # Schedule a message
-            schedule_result = await messages.MessagesClient().schedule_message(
-                "+1234567890", "Reminder message", "2025-05-30T18:00:00+09:00"
-            )
-            assert schedule_result["status"] == "scheduled"
-
-    @pytest.mark.asyncio
-    async def test_complete_workflow_notes(self):
-        """Test complete Notes workflow."""
-        with patch("pyhub.mcptools.apple.notes.applescript_run", new_callable=AsyncMock) as mock_run:
-            # Create a note
-            mock_run.return_value = "ID:::note123|||Name:::New Note"
-            create_result = await notes.create_note("New Note", "Content", "Work")
-            assert create_result["status"] == "success"
-            note_id = create_result["note_id"]
-
-            # Search for the note
-            mock_run.return_value = f"""ID:::{note_id}|||Name:::New Note|||Body:::Content<<<NOTE_END>>>"""
-            search_result = await notes.search_notes("New Note")
-            assert len(search_result) == 1
-            assert search_result[0]["ID"] == note_id
-
-            # Get the specific note
-            mock_run.return_value = f"ID:::{note_id}|||Name:::New Note|||Body:::Content|||Folder:::Work"
-            get_result = await notes.get_note(note_id)
-            assert get_result["ID"] == note_id
-            assert get_result["Folder"] == "Work"
-
-    @pytest.mark.asyncio
-    async def test_complete_workflow_contacts(self):
+    async def test_workflow_messages_unread(self, mock_applescript):
+        """Messages workflow: check unread count."""
+        mock_applescript(messages, return_value="3")
+        unread_before = await messages.get_unread_count()
+        assert unread_before == 3
+
+    @pytest.mark.asyncio
+    async def test_workflow_messages_send(self, mock_applescript):
+        """Messages workflow: send a message."""
+        mock_applescript(messages, return_value="SUCCESS")
+        send_result = await messages.send_message("+1234567890", "Hello!")
+        assert send_result["status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_workflow_messages_schedule(self, mock_applescript):
+        """Messages workflow: schedule a message."""
+        mock_applescript(messages, return_value="SUCCESS")
+        schedule_result = await messages.MessagesClient().schedule_message(
+            "+1234567890", "Reminder message", "2025-05-30T18:00:00+09:00"
+        )
+        assert schedule_result["status"] == "scheduled"
+
+    @pytest.mark.asyncio
+    async def test_workflow_notes_create(self, mock_applescript):
+        """Notes workflow: create a note."""
+        mock_applescript(notes, return_value="ID:::note123|||Name:::New Note")
+        create_result = await notes.create_note("New Note", "Content", "Work")
+        assert create_result["status"] == "success"
+        assert create_result["note_id"] == "note123"
+
+    @pytest.mark.asyncio
+    async def test_workflow_notes_search(self, mock_applescript):
+        """Notes workflow: search for the created note."""
+        mock_applescript(notes, return_value="""ID:::note123|||Name:::New Note|||Body:::Content<<<NOTE_END>>>""")
+        search_result = await notes.search_notes("New Note")
+        assert len(search_result) == 1
+        assert search_result[0]["ID"] == "note123"
+
+    @pytest.mark.asyncio
+    async def test_workflow_notes_get(self, mock_applescript):
+        """Notes workflow: get the created note."""
+        mock_applescript(notes, return_value="ID:::note123|||Name:::New Note|||Body:::Content|||Folder:::Work")
+        get_result = await notes.get_note("note123")
+        assert get_result["ID"] == "note123"
+        assert get_result["Folder"] == "Work"
+
+    @pytest.mark.asyncio
+    async def test_complete_workflow_contacts(self, mock_applescript):
         """Test complete Contacts workflow."""
-        with patch("pyhub.mcptools.apple.contacts.applescript_run", new_callable=AsyncMock) as mock_run:
-            # Create a contact
-            mock_run.return_value = "ID:::contact123"
-            create_result = await contacts.create_contact("John", "Doe", email="john@example.com", phone="+1234567890")
-            assert create_result["status"] == "success"
-            contact_id = create_result["contact_id"]
-
-            # Search for the contact
-            mock_run.return_value = (
-                f"ID:::{contact_id}|||Name:::John Doe|||"
-                f"Emails:::john@example.com|||Phones:::+1234567890<<<CONTACT_END>>>"
-            )
-            search_result = await contacts.search_contacts(name="John")
-            assert len(search_result) == 1
-            assert search_result[0]["ID"] == contact_id
-
-            # Get the specific contact
-            mock_run.return_value = (
-                f"ID:::{contact_id}|||Name:::John Doe|||Emails:::john@example.com|||Phones:::+1234567890"
-            )
-            get_result = await contacts.get_contact(contact_id)
-            assert get_result["ID"] == contact_id
-            assert get_result["Name"] == "John Doe"
+        contact_id = "contact123"
+        mock_run = mock_applescript(
+            contacts,
+            side_effect=[
+                # Create a contact
+                f"ID:::{contact_id}",
+                # Search for the contact
+                (
+                    f"ID:::{contact_id}|||Name:::John Doe|||Emails:::john@example.com|||"
+                    "Phones:::+1234567890<<<CONTACT_END>>>"
+                ),
+                # Get the specific contact
+                f"ID:::{contact_id}|||Name:::John Doe|||Emails:::john@example.com|||Phones:::+1234567890",
+            ],
+        )
+
+        create_result = await contacts.create_contact("John", "Doe", email="john@example.com", phone="+1234567890")
+        assert create_result["status"] == "success"
+        assert create_result["contact_id"] == contact_id
+
+        search_result = await contacts.search_contacts(name="John")
+        assert len(search_result) == 1
+        assert search_result[0]["ID"] == contact_id
+
+        get_result = await contacts.get_contact(contact_id)
+        assert get_result["ID"] == contact_id
+        assert get_result["Name"] == "John Doe"
+
+        assert mock_run.await_count == 3
@@ -11,10 +11,18 @@ from pyhub.mcptools.core.choices import OS
 from pyhub.mcptools.core.email_types import Email, EmailFolderType
 from pyhub.mcptools.core.json_utils import json_dumps
 
+_IS_MACOS = OS.current_is_macos()
+
+# Folder names (lowercase) with a dedicated mailbox; any other name is treated as a custom mailbox
+MAIL_FOLDER_TYPES = {
+    "inbox": EmailFolderType.INBOX,
+    "sent": EmailFolderType.SENT,
+}
+
 
 def _get_enabled_apple_tools():
     """Lazy evaluation of Apple tools enablement."""
-    return OS.current_is_macos() and settings.USE_APPLE_TOOLS
+    return _IS_MACOS and settings.USE_APPLE_TOOLS
 
 
 @mcp.tool(enabled=lambda: _get_enabled_apple_tools())
@@ -68,16 +76,8 @@ async def apple_mail(
 
     elif operation == "list":
         # Map folder parameter to EmailFolderType or custom folder
-        folder_type = None
-        folder_name = None
-
-        if folder.lower() == "inbox":
-            folder_type = EmailFolderType.INBOX
-        elif folder.lower() == "sent":
-            folder_type = EmailFolderType.SENT
-        else:
-            # Custom folder name
-            folder_name = folder
+        folder_type = MAIL_FOLDER_TYPES.get(folder.lower())
+        folder_name = None if folder_type else folder
 
         email_list: list[Email] = await mail.get_emails(
             max_hours=max_hours,
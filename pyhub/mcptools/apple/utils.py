@@ -1,10 +1,90 @@
 """Common utilities for Apple integrations."""
 
+import asyncio
+import hashlib
+import os
 import re
+import tempfile
+from pathlib import Path
 from typing import Dict, Optional
 
 from pyhub.mcptools.microsoft.excel.utils import applescript_run
 
+# Compiled .scpt paths keyed by script name
+_COMPILED_SCRIPTS: dict[str, Path] = {}
+
+
+def _get_applescript_timeout() -> int:
+    try:
+        from django.conf import settings
+
+        return settings.EXCEL_DEFAULT_TIMEOUT
+    except ImportError:
+        return 60
+
+
+async def _exec_osascript(program: str, *args: str) -> str:
+    process = await asyncio.create_subprocess_exec(
+        program,
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout_bytes, stderr_bytes = await asyncio.wait_for(process.communicate(), timeout=_get_applescript_timeout())
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+
+    if process.returncode != 0:
+        raise RuntimeError(stderr_bytes.decode().strip())
+
+    return stdout_bytes.decode().strip()
+
+
+async def _compile_applescript(name: str, source: str) -> Path:
+    """Compile AppleScript source into a .scpt file, reusing one compiled by an earlier process.
+
+    Compiled scripts are cached in the per-user app cache directory, not the shared temp directory,
+    so another user cannot plant a script that this process would run.
+    """
+    from django.conf import settings
+
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    compiled_dir = Path(settings.APP_CACHE_DIR) / "applescript"
+    compiled_path = compiled_dir / f"{name}-{digest}.scpt"
+
+    if not compiled_path.exists():
+        compiled_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, source_path = tempfile.mkstemp(suffix=".applescript", dir=compiled_dir)
+        tmp_path = f"{source_path}.scpt"
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(source)
+            await _exec_osascript("osacompile", "-o", tmp_path, source_path)
+            # Another process may compile the same script concurrently, so replace atomically.
+            os.replace(tmp_path, compiled_path)
+        finally:
+            for path in (source_path, tmp_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    return compiled_path
+
+
+async def applescript_run_compiled(name: str, source: str, *args: str) -> str:
+    """Run an AppleScript compiled once per script, passing parameters as argv.
+
+    The source must read its parameters with ``on run argv``. Values are passed as process
+    arguments, so they need no AppleScript string escaping.
+    """
+    compiled_path = _COMPILED_SCRIPTS.get(name)
+    if compiled_path is None or not compiled_path.exists():
+        compiled_path = _COMPILED_SCRIPTS[name] = await _compile_applescript(name, source)
+
+    return await _exec_osascript("osascript", str(compiled_path), *args)
+
 
 def escape_applescript_string(text: str) -> str:
     """Escape special characters for AppleScript strings."""
@@ -27,13 +107,27 @@ def parse_applescript_record(output: str, field_delimiter: str = "|||", kv_delim
         return result
 
     for field in output.split(field_delimiter):
-        if kv_delimiter in field:
-            key, value = field.split(kv_delimiter, 1)
+        key, sep, value = field.partition(kv_delimiter)
+        if sep:
             result[key.strip()] = value.strip()
 
     return result
 
 
+def parse_applescript_records(
+    output: str, record_delimiter: str, field_delimiter: str = "|||", kv_delimiter: str = ":::"
+) -> list[Dict[str, str]]:
+    """Parse delimiter-separated AppleScript records into a list of dictionaries, skipping empty records."""
+    if not output or output == "missing value":
+        return []
+
+    records = (
+        parse_applescript_record(record.strip(), field_delimiter, kv_delimiter)
+        for record in output.split(record_delimiter)
+    )
+    return [record for record in records if record]
+
+
 def build_date_filter_script(
     days_back: Optional[int] = None, start_date: Optional[str] = None, end_date: Optional[str] = None
 ) -> str:
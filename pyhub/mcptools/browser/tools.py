@@ -2,12 +2,18 @@
 Browser automation
 """
 
+import re
+
 import httpx
-from bs4 import BeautifulSoup
 from pydantic import Field
+from selectolax.lexbor import LexborHTMLParser
 
 from pyhub.mcptools import mcp
 
+HEAD_END_PATTERN = re.compile(rb"</head\s*>", re.IGNORECASE)
+# 청크 경계에 걸친 </head> 태그도 찾을 수 있도록, 이전 청크의 끝부분부터 다시 검색합니다.
+HEAD_END_MAX_LENGTH = 16
+
 
 @mcp.tool(experimental=True)
 async def get_webpage_metadata(
@@ -16,7 +22,8 @@ async def get_webpage_metadata(
     """Get metadata in a webpage"""
 
     async with httpx.AsyncClient(follow_redirects=True) as client:
-        response = await client.get(
+        async with client.stream(
+            "GET",
             url,
             headers={
                 "User-Agent": (
@@ -24,24 +31,35 @@ async def get_webpage_metadata(
                     "Chrome/120.0.0.0 Safari/537.36"
                 )
             },
-        )
-        response.raise_for_status()
+        ) as response:
+            response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+            # 메타데이터는 <head> 안에만 있으므로, </head> 를 받으면 나머지 본문은 내려받지 않습니다.
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                search_start = max(0, len(content) - HEAD_END_MAX_LENGTH)
+                content += chunk
+                if HEAD_END_PATTERN.search(content, search_start):
+                    break
 
-    metadata = {"title": soup.title.text if soup.title else None, "meta": {}}
+            html = content.decode(response.encoding or "utf-8", errors="replace")
 
-    # 메타 태그 정보 추출
-    for meta in soup.find_all("meta"):
-        name = meta.get("name") or meta.get("property")
-        if name:
-            content = meta.get("content")
-            metadata["meta"][name] = content
+    tree = LexborHTMLParser(html)
 
-    # Open Graph 태그 추출
+    title_node = tree.css_first("title")
+    metadata = {"title": title_node.text() if title_node else None, "meta": {}}
+
+    # 메타 태그 정보와 Open Graph 태그를 한 번의 순회로 추출
     og_tags = {}
-    for meta in soup.find_all("meta", property=lambda x: x and x.startswith("og:")):
-        og_tags[meta["property"]] = meta.get("content")
+    for meta in tree.css("meta"):
+        attrs = meta.attributes
+        name = attrs.get("name") or attrs.get("property")
+        if name:
+            metadata["meta"][name] = attrs.get("content")
+
+        property_name = attrs.get("property")
+        if property_name and property_name.startswith("og:"):
+            og_tags[property_name] = attrs.get("content")
 
     if og_tags:
         metadata["og"] = og_tags
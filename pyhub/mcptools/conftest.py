@@ -4,17 +4,17 @@ import pytest
 from django.utils.translation import activate, deactivate
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def use_english_language():
-    """Set English as the default language for all tests."""
+    """Set English as the default language for all tests (activated once per session)."""
     activate("en-US")
     yield
     deactivate()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def mcp_client():
-    """Return a FastMCP client instance for tests."""
+    """Return the FastMCP instance for tests. It is a module singleton, so it is shared across the session."""
     from pyhub.mcptools import mcp
 
     return mcp
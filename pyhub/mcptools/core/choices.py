@@ -1,4 +1,5 @@
 import sys
+from functools import cache
 
 from django.db.models import TextChoices
 
@@ -14,7 +15,9 @@ class OS(TextChoices):
     LINUX = "linux"
 
     @classmethod
+    @cache
     def get_current(cls) -> "OS":
+        # 실행 중에 운영체제가 바뀌지 않으므로, 한 번만 판별하여 재사용합니다.
         os_system = sys.platform.lower()
 
         match os_system:
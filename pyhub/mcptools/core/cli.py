@@ -1,49 +1,37 @@
 import asyncio
+import atexit
 import json
+import os
 import re
 import shutil
 import subprocess
 import sys
 import time
-from collections import deque
+from bisect import bisect_right
 from datetime import datetime
+from functools import cache, lru_cache
 from importlib.metadata import PackageNotFoundError, version
+from itertools import chain, islice
 from pathlib import Path
-from typing import Callable, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Sequence
 
-import httpx
 import typer
-from asgiref.sync import async_to_sync
 from click import Choice, ClickException
-from django.conf import settings
-from django.template.defaultfilters import filesizeformat
-from django.utils import timezone
-from mcp.types import EmbeddedResource, ImageContent, TextContent
-from mcp_proxy.sse_client import run_sse_client
-from pydantic import BaseModel, ValidationError
-from rich.console import Console
-from rich.table import Table
 from typer.core import TyperCommand
-from typer.models import ArgumentInfo, CommandFunctionType, OptionInfo
+from typer.models import CommandFunctionType
 
 from pyhub.mcptools.core.choices import (
     OS,
-    FormatChoices,
     McpHostChoices,
     TransportChoices,
 )
-from pyhub.mcptools.core.init import mcp
-from pyhub.mcptools.core.updater import apply_update
-from pyhub.mcptools.core.utils import (
-    get_config_path,
-    get_log_dir_path,
-    get_log_path_list,
-    open_with_default_editor,
-    read_config_file,
-)
-from pyhub.mcptools.core.utils.process import is_mcp_host_running, kill_mcp_host_process
-from pyhub.mcptools.core.utils.sse import is_mcp_sse_server_alive
-from pyhub.mcptools.core.versions import PackageVersionChecker
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from rich.console import Console
+
+# --version, --help 처럼 가벼운 명령의 시작 시간을 줄이기 위해
+# httpx, django, rich, mcp 등 무거운 모듈은 각 명령 함수 안에서 필요할 때 임포트합니다.
 
 
 class PyhubTyper(typer.Typer):
@@ -53,18 +41,64 @@ class PyhubTyper(typer.Typer):
         experimental: bool = False,
         **kwargs,
     ) -> Callable[[CommandFunctionType], TyperCommand]:
-        if experimental and not settings.EXPERIMENTAL:
+        if experimental:
+            from django.conf import settings
 
-            def empty_decorator(f: CommandFunctionType) -> CommandFunctionType:
-                return f
+            if not settings.EXPERIMENTAL:
 
-            return empty_decorator
+                def empty_decorator(f: CommandFunctionType) -> CommandFunctionType:
+                    return f
+
+                return empty_decorator
 
         return super().command(*args, **kwargs)
 
 
-app = PyhubTyper(add_completion=False)
-console = Console()
+@cache
+def get_console() -> "Console":
+    from rich.console import Console
+
+    return Console()
+
+
+# 첫 출력 시점에 rich Console을 생성하는 wrapper
+class LazyConsole:
+    def __getattr__(self, name):
+        return getattr(get_console(), name)
+
+
+# MCP 클라이언트가 stdio로 실행하는 경우처럼 터미널이 아니면, rich traceback(pygments 등)을 임포트하지 않습니다.
+app = PyhubTyper(
+    add_completion=False,
+    pretty_exceptions_enable=(
+        sys.stdout is not None and sys.stdout.isatty() and os.environ.get("PYHUB_MCPTOOLS_NO_RICH") != "1"
+    ),
+)
+console = LazyConsole()
+
+# json.loads로 해석될 수 있는 값의 시작 패턴 (숫자, true/false/null, NaN/Infinity, 문자열, 배열, 객체)
+JSON_VALUE_PATTERN = re.compile(r'\s*(?:-|\d|true|false|null|NaN|Infinity|"|\[|\{)')
+
+# 로그의 ISO 8601 형식 UTC 타임스탬프 (ex: 2025-01-01T00:00:00.000Z)
+LOG_TIMESTAMP_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)")
+
+# 로그 파일 크기별 출력 색상 : 100KB 미만, 100KB 이상, 1MB 이상, 10MB 이상, 100MB 이상
+LOG_SIZE_THRESHOLDS = (100 * 1024, 1024 * 1024, 10 * 1024 * 1024, 100 * 1024 * 1024)
+LOG_SIZE_COLORS = ("white", "blue", "green bold", "yellow bold", "red bold")
+
+# update 명령의 버전 포맷 (숫자.숫자.숫자)
+VERSION_PATTERN = re.compile(r"\A\d+\.\d+\.\d+\Z")
+
+_runner: Optional[asyncio.Runner] = None
+
+
+def _run(coro):
+    """CLI 명령에서 코루틴을 실행합니다. 이벤트 루프는 프로세스 내에서 한 번만 생성하여 재사용합니다."""
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+        atexit.register(_runner.close)
+    return _runner.run(coro)
 
 
 @app.callback(invoke_without_command=True)
@@ -77,7 +111,7 @@ def main(
             v = version("pyhub-mcptools")
         except PackageNotFoundError:
             v = "not found"
-        console.print(v, highlight=False)
+        print(v)
 
     elif ctx.invoked_subcommand is None:
         console.print(ctx.get_help())
@@ -92,11 +126,13 @@ def run(
 ):
     """지정 transport로 MCP 서버 실행 (디폴트: stdio)"""
 
+    from pyhub.mcptools.core.init import mcp
+
     if transport == TransportChoices.STDIO:
         mcp.run(transport="stdio")
 
     else:
-        console.print(f"Starting Experimental SSE MCP Server on {host}:{port}", highlight=False)
+        print(f"Starting Experimental SSE MCP Server on {host}:{port}")
 
         import uvicorn
 
@@ -133,6 +169,9 @@ def run_sse_proxy(
 
     # https://github.com/sparfenyuk/mcp-proxy?tab=readme-ov-file#1-stdio-to-sse
 
+    import httpx
+    from mcp_proxy.sse_client import run_sse_client
+
     headers = {}
 
     # 인증이 필요할 때, 헤더 활용
@@ -295,6 +334,12 @@ def show_app_paths(
         open_folder: 경로를 출력하고 폴더 열기 (기본값: 경로만 출력)
     """
 
+    from django.conf import settings
+    from rich.table import Table
+    from rich.text import Text
+
+    from pyhub.mcptools.core.utils import get_log_dir_path
+
     paths_to_open = []
     path_descriptions = []
 
@@ -331,23 +376,24 @@ def show_app_paths(
     table.add_column("Description", style="magenta")
 
     for (__, description), path in zip(path_descriptions, paths_to_open, strict=False):
-        table.add_row(str(path), description)
+        table.add_row(Text(str(path)), Text(description))
 
-    console.print(table)
+    console.print(table, highlight=False)
 
     if open_folder:
         path: Path
         for path in paths_to_open:
+            path_str = str(path)
             try:
                 match OS.get_current():
                     case OS.WINDOWS:
-                        subprocess.run(["explorer", str(path)], check=True)
+                        popen_detached(["explorer", path_str])
                     case OS.MACOS:
-                        subprocess.run(["open", str(path)], check=True)
+                        popen_detached(["open", path_str])
                     case OS.LINUX:
                         for file_manager in ["xdg-open", "nautilus", "thunar", "dolphin", "pcmanfm"]:
                             try:
-                                subprocess.run([file_manager, str(path)], check=True)
+                                popen_detached([file_manager, path_str])
                                 break
                             except (subprocess.SubprocessError, FileNotFoundError):
                                 continue
@@ -356,7 +402,7 @@ def show_app_paths(
                     case _:
                         console.print(f"[red]Unsupported operating system: {OS.get_current()}[/red]")
                 console.print(f"[green]Opened path: {path}[/green]")
-            except subprocess.CalledProcessError:
+            except OSError:
                 console.print(f"[red]Failed to open path: {path}[/red]")
 
 
@@ -364,10 +410,29 @@ def show_app_paths(
 def list_():
     """tools/resources/resource_templates/prompts 목록 출력"""
 
-    tools_list()
-    resources_list()
-    resource_templates_list()
-    prompts_list()
+    from pyhub.mcptools.core.init import mcp
+
+    async def _print_all():
+        # 4개 목록 조회를 동시에 시작하고, 먼저 조회된 목록부터 순서대로 바로 출력합니다.
+        tasks = [
+            ("tools", asyncio.ensure_future(mcp.list_tools()), ["name", "description"]),
+            ("resources", asyncio.ensure_future(mcp.list_resources()), None),
+            ("resource_templates", asyncio.ensure_future(mcp.list_resource_templates()), None),
+            ("prompts", asyncio.ensure_future(mcp.list_prompts()), None),
+        ]
+        try:
+            for title, task, columns in tasks:
+                print_as_table(title, await task, columns=columns)
+        finally:
+            # 앞선 조회가 실패하면, 남은 조회는 취소하고 이미 실패한 조회의 예외는 회수하여
+            # "Task exception was never retrieved" 경고가 출력되지 않도록 합니다.
+            for _, task, _ in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+    _run(_print_all())
 
 
 @app.command()
@@ -391,20 +456,9 @@ def tools_list(
 ):
     """도구 목록 출력"""
 
-    # list_ 함수에서 tools_list 함수 직접 호출 시에 디폴트 인자가 적용되면, ArgumentInfo/OptionInfo 객체가 적용됩니다.
-    if isinstance(tool_names, ArgumentInfo):
-        tool_names = tool_names.default
-
-    if isinstance(verbosity, OptionInfo):
-        verbosity = verbosity.default
-
-    if isinstance(only_input_schema, OptionInfo):
-        only_input_schema = only_input_schema.default
-
-    if isinstance(indent, OptionInfo):
-        indent = indent.default
+    from pyhub.mcptools.core.init import mcp
 
-    tools = async_to_sync(mcp.list_tools)()
+    tools = _run(mcp.list_tools())
 
     if only_input_schema:
         for tool in tools:
@@ -435,6 +489,11 @@ def tools_call(
 ):
     """테스트 목적으로 MCP 인터페이스를 거치지 않고 지정 도구를 직접 호출 (지원 도구 목록 : tools-list 명령)"""
 
+    from mcp.types import EmbeddedResource, ImageContent, TextContent
+    from pydantic import ValidationError
+
+    from pyhub.mcptools.core.init import mcp
+
     arguments = {}
     if tool_args:
         for arg in tool_args:
@@ -444,19 +503,22 @@ def tools_call(
                 console.print(f"[red]Invalid argument format: '{arg}'. Use key=value[/red]")
                 raise typer.Exit(1) from e
 
-            # Attempt to parse value as JSON
-            try:
-                arguments[key] = json.loads(value)
-            except json.JSONDecodeError:
-                # Fallback to string if not valid JSON
+            # JSON 값으로 시작하는 경우에만 JSON 파싱을 시도하여, 일반 문자열에 대한 예외 발생 비용을 줄입니다.
+            if JSON_VALUE_PATTERN.match(value):
+                try:
+                    arguments[key] = json.loads(value)
+                except json.JSONDecodeError:
+                    # Fallback to string if not valid JSON
+                    arguments[key] = value
+            else:
                 arguments[key] = value
 
     if is_verbose:
-        console.print(f"Calling tool '{tool_name}' with arguments: {arguments}")
+        print(f"Calling tool '{tool_name}' with arguments: {arguments}")
 
     return_value: Sequence[TextContent | ImageContent | EmbeddedResource]
     try:
-        return_value = async_to_sync(mcp.call_tool)(tool_name, arguments=arguments)
+        return_value = _run(mcp.call_tool(tool_name, arguments=arguments))
     except ValidationError as e:
         if is_verbose:
             console.print_exception()
@@ -487,21 +549,30 @@ def tools_call(
 @app.command()
 def resources_list():
     """리소스 목록 출력"""
-    resources = async_to_sync(mcp.list_resources)()
+
+    from pyhub.mcptools.core.init import mcp
+
+    resources = _run(mcp.list_resources())
     print_as_table("resources", resources)
 
 
 @app.command()
 def resource_templates_list():
     """리소스 템플릿 목록 출력"""
-    resource_templates = async_to_sync(mcp.list_resource_templates)()
+
+    from pyhub.mcptools.core.init import mcp
+
+    resource_templates = _run(mcp.list_resource_templates())
     print_as_table("resource_templates", resource_templates)
 
 
 @app.command()
 def prompts_list():
     """프롬프트 목록 출력"""
-    prompts = async_to_sync(mcp.list_prompts)()
+
+    from pyhub.mcptools.core.init import mcp
+
+    prompts = _run(mcp.list_prompts())
     print_as_table("prompts", prompts)
 
 
@@ -564,7 +635,10 @@ def setup_add(
         current_exe_path = f"{python_exe} -m pyhub.mcptools"
 
     if transport == TransportChoices.SSE:
-        if async_to_sync(is_mcp_sse_server_alive)(sse_url=sse_url):
+        from pyhub.mcptools.core.utils.sse import is_mcp_sse_server_alive, is_tcp_port_open
+
+        # TCP 연결조차 되지 않으면, SSE 요청 없이 바로 실패로 처리합니다.
+        if is_tcp_port_open(sse_url) and _run(is_mcp_sse_server_alive(sse_url=sse_url)):
             if is_verbose:
                 console.print(f"[green]✔ SSE 서버 연결 성공: {sse_url}[/green]")
         else:
@@ -615,9 +689,11 @@ def setup_write(
     }
 
     if is_dry is True:
-        console.print(json.dumps(new_config, indent=4, ensure_ascii=False))
+        print(json.dumps(new_config, indent=4, ensure_ascii=False))
 
     else:
+        from pyhub.mcptools.core.utils import get_config_path, read_config_file, write_config_file
+
         config_path = get_config_path(mcp_host, is_verbose, allow_exit=True)
         print(f"config_path : {config_path}")
 
@@ -626,25 +702,23 @@ def setup_write(
         except FileNotFoundError:
             config_data = {}
 
-        config_data.setdefault("mcpServers", {})
+        mcp_servers = config_data.setdefault("mcpServers", {})
 
-        if config_name in config_data["mcpServers"]:
+        if config_name in mcp_servers:
             is_confirm = typer.confirm(f"{config_path} 설정에 {config_name} 설정이 이미 있습니다. 덮어쓰시겠습니까?")
             if not is_confirm:
                 raise typer.Abort()
 
-        config_data["mcpServers"][config_name] = new_config
+        mcp_servers[config_name] = new_config
 
         # Claude 설정 폴더가 없다면, FileNotFoundError 예외가 발생합니다.
         try:
-            with open(config_path, "wt", encoding="utf-8") as f:
-                json_str = json.dumps(config_data, indent=2, ensure_ascii=False)
-                f.write(json_str)
+            write_config_file(config_path, config_data)
         except FileNotFoundError as e:
             console.print("[red]Claude Desktop 프로그램을 먼저 설치해주세요. - https://claude.ai/download[/red]")
             raise typer.Abort() from e
 
-        console.print(f"'{config_path}' 경로에 {config_name} 설정을 추가했습니다.", highlight=False)
+        print(f"'{config_path}' 경로에 {config_name} 설정을 추가했습니다.")
 
 
 @app.command()
@@ -655,6 +729,8 @@ def setup_print(
 ):
     """[MCP 설정파일] 표준 출력"""
 
+    from pyhub.mcptools.core.utils import get_config_path, read_config_file
+
     if all_:
         config_data = {}
         for mcp_host in McpHostChoices:
@@ -673,7 +749,7 @@ def setup_print(
         try:
             config_data = read_config_file(config_path)
         except FileNotFoundError as e:
-            console.print(f"{config_path} 파일이 없습니다.")
+            print(f"{config_path} 파일이 없습니다.")
             raise typer.Abort() from e
 
     print(json.dumps(config_data, indent=4, ensure_ascii=False))
@@ -686,6 +762,8 @@ def setup_edit(
 ):
     """[MCP 설정파일] 가용 에디터로 편집"""
 
+    from pyhub.mcptools.core.utils import get_config_path, open_with_default_editor
+
     config_path = get_config_path(mcp_host, is_verbose, allow_exit=True)
     open_with_default_editor(config_path, is_verbose)
 
@@ -701,12 +779,14 @@ def setup_remove(
 ):
     """[MCP 설정파일] 지정 서버 제거"""
 
+    from pyhub.mcptools.core.utils import get_config_path, read_config_file, write_config_file
+
     config_path = get_config_path(mcp_host, is_verbose, allow_exit=True)
 
     try:
         config_data = read_config_file(config_path)
     except FileNotFoundError as e:
-        console.print(f"{config_path} 파일이 없습니다.")
+        print(f"{config_path} 파일이 없습니다.")
         raise typer.Abort() from e
 
     if not isinstance(config_data, dict):
@@ -717,7 +797,8 @@ def setup_remove(
         raise ClickException("등록된 mcpServers 설정이 없습니다.")
 
     if config_name is None:
-        setup_print(mcp_host=mcp_host, fmt=FormatChoices.TABLE, is_verbose=is_verbose)
+        # 이미 읽어둔 설정으로 목록을 출력하여, 설정 파일을 다시 읽지 않습니다.
+        print_mcp_servers_table(mcp_servers)
 
         # choice >= 1
         choice: str = typer.prompt(
@@ -728,7 +809,7 @@ def setup_remove(
         )
 
         idx = int(choice) - 1
-        config_name = tuple(mcp_servers.keys())[idx]
+        config_name = next(islice(mcp_servers, idx, None))
 
         # 확인 메시지
         if not typer.confirm(f"설정에서 '{config_name}' 서버를 제거하시겠습니까?"):
@@ -741,13 +822,8 @@ def setup_remove(
     except KeyError as e:
         raise ClickException(f"{config_name} 설정을 찾을 수 없습니다.") from e
 
-    config_data["mcpServers"] = mcp_servers
-
     # 설정 파일에 저장
-    config_path = get_config_path(mcp_host, is_verbose, allow_exit=True)
-    with open(config_path, "wt", encoding="utf-8") as f:
-        json_str = json.dumps(config_data, indent=2, ensure_ascii=False)
-        f.write(json_str)
+    write_config_file(config_path, config_data)
 
     console.print(f"[green]'{config_name}' 서버가 성공적으로 제거했습니다.[/green]")
 
@@ -761,6 +837,8 @@ def setup_backup(
 ):
     """[MCP 설정파일] 지정 경로로 백업"""
 
+    from pyhub.mcptools.core.utils import get_config_path
+
     dest_path = dest.resolve()
     src_path = get_config_path(mcp_host, is_verbose, allow_exit=True)
 
@@ -768,7 +846,7 @@ def setup_backup(
         dest_path = dest_path / src_path.name
 
     if dest_path.exists() and not is_force:
-        console.print("지정 경로에 파일이 있어 파일을 복사할 수 없습니다.")
+        print("지정 경로에 파일이 있어 파일을 복사할 수 없습니다.")
         raise typer.Exit(1)
 
     try:
@@ -787,6 +865,8 @@ def setup_restore(
 ):
     """[MCP 설정파일] 복원"""
 
+    from pyhub.mcptools.core.utils import get_config_path
+
     src_path = src.resolve()
     dest_path = get_config_path(mcp_host, is_verbose, allow_exit=True)
 
@@ -794,7 +874,8 @@ def setup_restore(
         src_path = src_path / dest_path.name
 
     try:
-        shutil.copy2(src_path, dest_path)
+        # 복원 시에는 백업 파일의 메타데이터(수정시각, 권한)가 필요없으므로 내용만 복사합니다.
+        shutil.copyfile(src_path, dest_path)
         console.print("[green]설정 파일을 복원했습니다.[/green]")
     except IOError as e:
         console.print(f"[red]파일 복사 중 오류가 발생했습니다: {e}[/red]")
@@ -1000,14 +1081,16 @@ def check_update():
         console.print("[red]패키징된 실행파일에서만 버전 확인을 지원합니다.[/red]")
         raise typer.Exit(1)
 
+    from pyhub.mcptools.core.versions import PackageVersionChecker
+
     package_name = "pyhub-mcptools"
     version_check = PackageVersionChecker.check_update(package_name, is_force=True)
 
     if not version_check.has_update:
-        console.print(f"이미 최신 버전({version_check.installed})입니다.", highlight=False)
+        print(f"이미 최신 버전({version_check.installed})입니다.")
     else:
         latest_url = f"https://github.com/pyhub-kr/pyhub-mcptools/releases/tag/v{version_check.latest}"
-        console.print(f"{latest_url} 페이지에서 최신 버전을 다운받으실 수 있습니다.")
+        print(f"{latest_url} 페이지에서 최신 버전을 다운받으실 수 있습니다.")
 
 
 @app.command()
@@ -1026,24 +1109,35 @@ def update(
         raise typer.Exit(1)
 
     # 버전 포맷 검사 (숫자.숫자.숫자)
-    if target_version and not re.match(r"^\d+\.\d+\.\d+$", target_version):
+    if target_version and not VERSION_PATTERN.match(target_version):
         console.print(f"[red]버전 형식이 잘못되었습니다. '숫자.숫자.숫자' 형식이어야 합니다: {target_version}[/red]")
         raise typer.Exit(1)
 
+    from pyhub.mcptools.core.updater import apply_update
+    from pyhub.mcptools.core.utils.process import is_mcp_host_running, kill_mcp_host_process
+    from pyhub.mcptools.core.versions import PackageVersionChecker, VersionCheck
+
     package_name = "pyhub-mcptools"
-    version_check = PackageVersionChecker.check_update(package_name)
 
     if target_version:
-        version_check.latest = target_version
+        # 버전을 지정한 경우에는 최신 버전 조회(네트워크 요청)가 필요없습니다.
+        version_check = VersionCheck(
+            installed=PackageVersionChecker.get_installed_version(package_name),
+            latest=target_version,
+            has_update=True,
+        )
         console.print(f"[blue]지정된 버전({target_version})으로 업데이트합니다.[/blue]")
 
-    elif not version_check.has_update and not force:
-        console.print(f"이미 최신 버전({version_check.installed})입니다.", highlight=False)
-        raise typer.Exit(0)
+    else:
+        version_check = PackageVersionChecker.check_update(package_name)
+
+        if not version_check.has_update and not force:
+            print(f"이미 최신 버전({version_check.installed})입니다.")
+            raise typer.Exit(0)
 
-    elif not version_check.has_update and force:
-        version_check.latest = version_check.installed
-        console.print(f"[yellow]같은 버전({version_check.installed})이라도 강제 업데이트를 진행합니다.[/yellow]")
+        elif not version_check.has_update and force:
+            version_check.latest = version_check.installed
+            console.print(f"[yellow]같은 버전({version_check.installed})이라도 강제 업데이트를 진행합니다.[/yellow]")
 
     # Claude/Cursor가 실행 중인 경우에만 종료 확인
     mcp_hosts_to_check = [McpHostChoices.CLAUDE]  # 필요시 Cursor 추가 가능
@@ -1069,7 +1163,7 @@ def update(
             f"현재 버전 {version_check.installed}에서 {version_check.latest}로 업데이트하시겠습니까?"
         )
         if not confirm:
-            console.print("업데이트를 취소하셨습니다.")
+            print("업데이트를 취소하셨습니다.")
             raise typer.Exit(0)
 
     console.print(f"[green]업데이트할 버전 {version_check.latest}[/green]")
@@ -1083,6 +1177,8 @@ def kill(
 ):
     """MCP 설정 적용을 위해 Claude 등의 MCP 클라이언트 프로세스를 죽입니다."""
 
+    from pyhub.mcptools.core.utils.process import kill_mcp_host_process
+
     kill_mcp_host_process(mcp_host)
 
     console.print(f"[green]Killed {mcp_host.value} processes[/green]")
@@ -1092,12 +1188,17 @@ def kill(
 def release_note():
     """릴리스 노트 출력"""
 
+    import httpx
+
     url = "https://raw.githubusercontent.com/pyhub-kr/pyhub-mcptools/refs/heads/main/docs/release-notes.md"
 
     try:
-        response = httpx.get(url)
-        response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
-        print(response.text)
+        # 전체 문서를 메모리에 담지 않고, 수신되는 대로 표준 출력으로 바로 씁니다.
+        with httpx.stream("GET", url, timeout=10.0) as response:
+            response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
+            for chunk in response.iter_bytes(chunk_size=65536):
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
     except httpx.HTTPError as e:
         console.print(f"[red]릴리스 노트를 가져오는 중 오류가 발생했습니다: {e}[/red]")
         raise typer.Exit(1) from e
@@ -1132,6 +1233,14 @@ def log_tail(
         is_verbose: 상세 정보 출력 여부
         timestamp_format: 타임스탬프 출력 포맷 (기본값: "%Y-%m-%d %H:%M:%S")
     """
+
+    from django.template.defaultfilters import filesizeformat
+    from django.utils import timezone
+    from rich.table import Table
+    from rich.text import Text
+
+    from pyhub.mcptools.core.utils import FileAppendWaiter, get_log_path_list, read_last_lines
+
     try:
         path_list = get_log_path_list(mcp_host)
         if not path_list:
@@ -1149,13 +1258,19 @@ def log_tail(
                 raise typer.Exit(0)
 
         # 파일들을 찾아서 수정시각 기준으로 내림차순 정렬
-        path_list = sorted(path_list, key=lambda p: p.stat().st_mtime, reverse=True)
+        # 파일마다 stat은 한 번만 호출하여, 정렬과 목록 출력에 함께 사용합니다.
+        path_stat_list = sorted(
+            ((p, p.stat()) for p in path_list),
+            key=lambda path_stat: path_stat[1].st_mtime,
+            reverse=True,
+        )
+        path_list = [p for p, __ in path_stat_list]
 
         # 단일 경로인 경우 자동 선택
         if len(path_list) == 1:
             path = path_list[0]
             if is_verbose:
-                console.print(f"\n단일 로그 파일을 자동 선택합니다: {path}")
+                print(f"\n단일 로그 파일을 자동 선택합니다: {path}")
         else:
             table = Table()
             table.add_column("id", justify="right")
@@ -1163,37 +1278,17 @@ def log_tail(
             table.add_column("mtime")
             table.add_column("size", justify="right")  # 우측 정렬 지정
 
-            def get_size_color(size_bytes: int) -> str:
-                if size_bytes >= 100 * 1024 * 1024:  # 100MB 이상
-                    return "red bold"
-                elif size_bytes >= 10 * 1024 * 1024:  # 10MB 이상
-                    return "yellow bold"
-                elif size_bytes >= 1024 * 1024:  # 1MB 이상
-                    return "green bold"
-                elif size_bytes >= 100 * 1024:  # 100KB 이상
-                    return "blue"
-                else:
-                    return "white"
-
-            def replace_timestamp(match):
-                utc_str = match.group(1)
-                # UTC 시간을 파싱
-                utc_dt = datetime.strptime(utc_str, "%Y-%m-%dT%H:%M:%S.%fZ")
-                local_dt = utc_dt.astimezone(tz)
-                # 시간과 함께 timezone 정보도 출력
-                return f"{local_dt.strftime(timestamp_format)}"
-
-            for idx, path in enumerate(path_list, start=1):
-                stat = path.stat()
+            tz = timezone.get_current_timezone()
+            for idx, (path, stat) in enumerate(path_stat_list, start=1):
                 mtime_timestamp = stat.st_mtime
-                tz = timezone.get_current_timezone()
                 mtime_datetime = datetime.fromtimestamp(mtime_timestamp, tz=tz)
+                size_color = get_size_color(stat.st_size)
 
                 table.add_row(
                     str(idx),
-                    path.name,
+                    Text(path.name),
                     mtime_datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                    f"[{get_size_color(stat.st_size)}]{filesizeformat(stat.st_size)}[/{get_size_color(stat.st_size)}]",
+                    Text(filesizeformat(stat.st_size), style=size_color),
                 )
 
             console.print(table)
@@ -1209,34 +1304,56 @@ def log_tail(
             path = path_list[idx]
 
         if is_verbose:
-            console.print(f"\n로그 파일 경로: {path}")
-
-        with open(path, "r", encoding="utf-8") as f:
-            # 파일의 마지막 N줄만 읽기
-            last_lines = deque(f, n_lines)
-
-            # ISO 8601 형식의 UTC 타임스탬프를 찾아서 현재 timezone으로 변환
-            iso_pattern = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)")
-            tz = timezone.get_current_timezone()
-
-            for line in last_lines:
-                converted_line = iso_pattern.sub(replace_timestamp, line)
-                print(converted_line, end="")
-
-            if is_follow:
-                # 파일의 끝으로 이동
-                f.seek(0, 2)
+            print(f"\n로그 파일 경로: {path}")
+
+        # ISO 8601 형식의 UTC 타임스탬프를 찾아서 현재 timezone으로 변환
+        # 같은 초에 기록된 라인이 많으므로, 출력 포맷에 %f(마이크로초)가 없다면 초 단위로 변환 결과를 재사용합니다.
+        timestamp_key_length = 23 if "%f" in timestamp_format else 19  # "YYYY-MM-DDTHH:MM:SS[.mmm]"
+
+        @lru_cache(maxsize=1024)
+        def convert_timestamp(
+            utc_str: str,
+            _tz=timezone.get_current_timezone(),
+            _fmt=timestamp_format,
+            _fromisoformat=datetime.fromisoformat,
+        ) -> str:
+            # UTC 시간을 파싱 (파이썬 3.11부터 "Z" 접미사를 지원하며, strptime보다 훨씬 빠릅니다.)
+            utc_dt = _fromisoformat(utc_str + "Z")
+            return utc_dt.astimezone(_tz).strftime(_fmt)
+
+        # 라인마다 호출되므로 필요한 값은 기본 인자로 바인딩하여 지역 변수로 조회합니다.
+        def replace_timestamp(match, _convert=convert_timestamp, _key_length=timestamp_key_length):
+            return _convert(match.group(1)[:_key_length])
+
+        sub_timestamp = LOG_TIMESTAMP_PATTERN.sub
+
+        def convert_line(line: str) -> str:
+            # 타임스탬프가 없는 라인(스택 트레이스 등)은 정규식 검색보다 훨씬 빠른 문자열 검사로 걸러냅니다.
+            if "T" in line and "Z" in line:
+                return sub_timestamp(replace_timestamp, line)
+            return line
+
+        # 파일의 마지막 N줄만 읽기 (파일 끝에서부터 읽어서, 큰 로그 파일도 전체를 읽지 않습니다.)
+        last_lines, end_pos = read_last_lines(path, n_lines)
+        sys.stdout.write("".join(convert_line(line) for line in last_lines))
+        sys.stdout.flush()
+
+        if is_follow:
+            with open(path, "r", encoding="utf-8") as f, FileAppendWaiter(f) as waiter:
+                # 마지막 N줄을 읽은 위치로 이동합니다. (그 사이에 추가된 라인도 빠짐없이 출력)
+                f.seek(end_pos)
                 while True:
-                    line = f.readline()
-                    if line:
-                        # 실시간 모니터링에서도 타임스탬프 변환 적용
-                        converted_line = iso_pattern.sub(replace_timestamp, line)
-                        print(converted_line, end="")
-                    else:
-                        # 새로운 라인이 없으면 잠시 대기
-                        time.sleep(0.1)
+                    # 새로 추가된 라인을 모두 읽어서, 라인마다 출력하지 않고 한 번에 출력합니다.
+                    # 실시간 모니터링에서도 타임스탬프 변환 적용
+                    converted_lines = [convert_line(line) for line in iter(f.readline, "")]
+                    if converted_lines:
+                        sys.stdout.write("".join(converted_lines))
+                        sys.stdout.flush()
+
+                    # 새로운 라인이 추가될 때까지 대기
+                    waiter.wait()
     except KeyboardInterrupt:
-        console.print("\n로그 모니터링을 종료합니다.")
+        print("\n로그 모니터링을 종료합니다.")
     except FileNotFoundError as e:
         console.print(f"\n[red]로그 파일을 찾을 수 없습니다: {path}[/red]")
         raise typer.Exit(1) from e
@@ -1245,37 +1362,83 @@ def log_tail(
         raise typer.Exit(1) from e
 
 
+def get_size_color(size_bytes: int) -> str:
+    return LOG_SIZE_COLORS[bisect_right(LOG_SIZE_THRESHOLDS, size_bytes)]
+
+
+def popen_detached(args: list[str]) -> None:
+    """파일 탐색기 등의 GUI 프로그램을 실행하고, 프로그램 종료를 기다리지 않고 바로 반환합니다."""
+    if OS.current_is_windows():
+        subprocess.Popen(
+            args,
+            creationflags=subprocess.DETACHED_PROCESS,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        subprocess.Popen(
+            args,
+            start_new_session=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+
+def print_mcp_servers_table(mcp_servers: dict) -> None:
+    from rich.table import Table
+    from rich.text import Text
+
+    table = Table(title="[bold]mcpServers[/bold]", title_justify="left")
+    table.add_column("id", justify="right")
+    table.add_column("name")
+    table.add_column("command")
+
+    for idx, (name, server_config) in enumerate(mcp_servers.items(), start=1):
+        command = " ".join([server_config.get("command", ""), *server_config.get("args", [])])
+        table.add_row(str(idx), Text(name), Text(command))
+
+    console.print(table, highlight=False)
+
+
 def print_as_table(
     title: str,
-    rows: list[BaseModel],
+    rows: Iterable["BaseModel"],
     columns: Optional[list[str]] = None,
     tool_names: Optional[list[str]] = None,
 ) -> None:
-    if len(rows) > 0:
-        table = Table(title=f"[bold]{title}[/bold]", title_justify="left")
+    from rich.table import Table
+    from rich.text import Text
+
+    rows = iter(rows)
+    first_row = next(rows, None)
 
-        row = rows[0]
-        row_dict = row.model_dump()
+    if first_row is not None:
+        table = Table(title=f"[bold]{title}[/bold]", title_justify="left")
 
-        column_names = columns or row_dict.keys()
-        column_names = [name for name in column_names if name in row_dict]
+        if columns:
+            # 컬럼이 지정된 경우에는 모델 클래스의 필드 정보로 확인하여, 첫 행을 따로 직렬화하지 않습니다.
+            # mcp 모델은 extra="allow" 이므로, 추가 필드(model_extra)도 함께 확인합니다.
+            model_fields = type(first_row).model_fields
+            model_extra = first_row.model_extra or {}
+            column_names = [name for name in columns if name in model_fields or name in model_extra]
+        else:
+            column_names = list(first_row.model_dump().keys())
 
         for name in column_names:
             table.add_column(name)
 
-        for row in rows:
-            columns = []
-            for name in column_names:
-                value = getattr(row, name, None)
-                columns.append(f"{value}")
+        for row in chain((first_row,), rows):
+            # extra="allow" 모델은 행마다 추가 필드가 다를 수 있으므로, 없는 필드는 None 으로 출력합니다.
+            cells = [f"{getattr(row, name, None)}" for name in column_names]
 
-            if tool_names is not None:
-                if columns[0] not in tool_names:
-                    continue
+            if tool_names is not None and cells[0] not in tool_names:
+                continue
 
-            table.add_row(*columns)
+            # Text 객체로 전달하여 셀마다 markup 파싱이 수행되지 않도록 합니다.
+            table.add_row(*(Text(cell) for cell in cells))
 
-        console.print(table)
+        # 행이 많을 때 셀마다 수행되는 자동 하이라이트(정규식) 비용을 피합니다.
+        console.print(table, highlight=False)
 
     else:
         console.print(f"[gray]no {title}[/gray]")
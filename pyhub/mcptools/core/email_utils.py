@@ -1,7 +1,11 @@
 """Email utility functions."""
 
+import re
 from typing import Union
 
+# 콤마와 그 주변의 공백을 한 번에 구분자로 처리합니다.
+EMAIL_LIST_SEPARATOR_PATTERN = re.compile(r"\s*,\s*")
+
 
 def parse_email_list(emails: Union[str, list[str], None]) -> list[str]:
     """Convert email string or list to normalized list.
@@ -20,7 +24,7 @@ def parse_email_list(emails: Union[str, list[str], None]) -> list[str]:
 
     if isinstance(emails, str):
         # Split by comma and strip whitespace
-        return [email.strip() for email in emails.split(",") if email.strip()]
+        return [email for email in EMAIL_LIST_SEPARATOR_PATTERN.split(emails.strip()) if email]
 
     # Already a list
     return emails
@@ -2,7 +2,7 @@ import asyncio
 import inspect
 import multiprocessing
 import re
-from functools import wraps
+from functools import cache, wraps
 from typing import Callable
 
 from django.conf import settings
@@ -22,6 +22,16 @@ class SyncFunctionNotAllowedError(TypeError):
     pass
 
 
+def normalize_tool_name(name: str) -> str:
+    return name.replace("-", "_")
+
+
+@cache
+def compile_tool_name_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    """ONLY_EXPOSE_TOOLS 패턴을 한 번만 컴파일하여, 도구마다 재사용합니다."""
+    return tuple(re.compile(normalize_tool_name(pattern)) for pattern in patterns)
+
+
 class FastMCP(OrigFastMCP):
     DEFAULT_PROCESS_TIMEOUT = 30
 
@@ -92,20 +102,25 @@ class FastMCP(OrigFastMCP):
                 sig = inspect.signature(delegator)
                 fn.__signature__ = sig
 
-            @wraps(fn)
-            async def wrapper(*args, **kwargs):
-                if delegator is None:
+            # delegator 지정 여부는 등록 시점에 결정되므로, 호출마다 분기하지 않도록 wrapper를 따로 정의합니다.
+            if delegator is None:
+
+                @wraps(fn)
+                async def wrapper(*args, **kwargs):
                     return await fn(*args, **kwargs)
 
-                # 멀티 프로세싱 방식으로 실행하여, timeout이 발생하면 강제 종료
-                return execute_with_process_timeout(
-                    delegator,
-                    *args,
-                    timeout=effective_timeout,
-                    **kwargs,
-                )
+            else:
+
+                @wraps(fn)
+                async def wrapper(*args, **kwargs):
+                    # 멀티 프로세싱 방식으로 실행하여, timeout이 발생하면 강제 종료
+                    return execute_with_process_timeout(
+                        delegator,
+                        *args,
+                        timeout=effective_timeout,
+                        **kwargs,
+                    )
 
-            if delegator is not None:
                 # wrapper에 우리가 덮어쓴 메타를 다시 붙여주기
                 wrapper.__doc__ = fn.__doc__
                 wrapper.__annotations__ = fn.__annotations__  # noqa
@@ -121,13 +136,10 @@ class FastMCP(OrigFastMCP):
             if settings.ONLY_EXPOSE_TOOLS:
                 tool_name = name or fn.__name__
 
-                def normalize_name(_name: str) -> str:
-                    return _name.replace("-", "_")
-
-                normalized_tool_name = normalize_name(tool_name)
+                normalized_tool_name = normalize_tool_name(tool_name)
                 is_allowed = any(
-                    re.fullmatch(normalize_name(pattern), normalized_tool_name)
-                    for pattern in settings.ONLY_EXPOSE_TOOLS
+                    pattern.fullmatch(normalized_tool_name)
+                    for pattern in compile_tool_name_patterns(tuple(settings.ONLY_EXPOSE_TOOLS))
                 )
                 if not is_allowed:
                     return wrapper
@@ -1,6 +1,6 @@
 """JSON utilities for MCP tools."""
 
-import base64
+import binascii
 import json
 from dataclasses import asdict, is_dataclass
 from datetime import date, datetime
@@ -51,11 +51,13 @@ class JSONEncoder(json.JSONEncoder):
             return o.isoformat()
         elif isinstance(o, bytes):
             if self.use_base64:
-                return base64.b64encode(o).decode("ascii")
+                return binascii.b2a_base64(o, newline=False).decode("ascii")
             return o.decode("utf-8")
         elif isinstance(o, memoryview):
             if self.use_base64:
-                return base64.b64encode(o.tobytes()).decode("ascii")
+                # 연속된 memoryview 는 복사(tobytes) 없이 그대로 인코딩합니다. (슬라이싱된 view 는 복사가 필요)
+                data = o if o.c_contiguous else o.tobytes()
+                return binascii.b2a_base64(data, newline=False).decode("ascii")
             return o.tobytes().decode("utf-8")
         elif isinstance(o, (set, frozenset)):
             return list(o)
@@ -1,10 +1,13 @@
+import io
 import json
 import locale
 import logging
 import os
+import select
 import subprocess
 import sys
 import tempfile
+import time
 from pathlib import Path
 from typing import Literal, Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -177,6 +180,77 @@ def get_log_path_list(mcp_host: McpHostChoices) -> list[Path]:
     return list(get_log_dir_path(mcp_host).glob("mcp*.log"))
 
 
+def read_last_lines(path: Path, n_lines: int, block_size: int = 8192) -> tuple[list[str], int]:
+    """파일의 마지막 N줄과, 읽은 위치(파일 끝의 바이트 오프셋)를 반환합니다.
+
+    파일 끝에서부터 블록 단위로 읽어서, 파일 전체를 읽지 않습니다.
+    반환된 오프셋으로 seek 하면, 이후에 추가된 내용을 빠짐없이 이어서 읽을 수 있습니다.
+    """
+    blocks = []
+    newline_count = 0
+
+    with open(path, "rb") as f:
+        end_pos = pos = f.seek(0, os.SEEK_END)
+        if n_lines <= 0:
+            return [], end_pos
+
+        # 마지막 줄이 개행으로 끝나는 경우까지 고려하여, N+1 개의 개행을 찾을 때까지 읽습니다.
+        while pos > 0 and newline_count <= n_lines:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size)
+            blocks.append(block)
+            newline_count += block.count(b"\n")
+
+    text = b"".join(reversed(blocks)).decode("utf-8", errors="replace")
+    # 텍스트 모드로 파일을 읽을 때처럼 \r\n, \r 개행을 \n 으로 변환합니다.
+    lines = list(io.StringIO(text, newline=None))
+    return lines[-n_lines:], end_pos
+
+
+class FileAppendWaiter:
+    """파일에 내용이 추가될 때까지 대기합니다. with 문에서 사용 가능합니다.
+
+    kqueue를 지원하는 OS(macOS)에서는 파일 변경 이벤트를 기다려서 유휴 시에 CPU를 깨우지 않고,
+    그 외 OS에서는 poll_interval 간격으로 대기합니다.
+    """
+
+    def __init__(self, f, poll_interval: float = 0.1, max_wait: float = 1.0):
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.kqueue = None
+
+        if hasattr(select, "kqueue"):
+            self.kqueue = select.kqueue()
+            # KQ_EV_CLEAR : 대기 중이 아닐 때 발생한 이벤트도 한 번 전달되고, 전달 후에 초기화됩니다.
+            event = select.kevent(
+                f.fileno(),
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND,
+            )
+            self.kqueue.control([event], 0, 0)
+
+    def wait(self) -> None:
+        if self.kqueue is None:
+            time.sleep(self.poll_interval)
+        else:
+            # 파일 교체 등으로 이벤트를 놓치더라도 max_wait 마다 한 번은 확인합니다.
+            self.kqueue.control(None, 1, self.max_wait)
+
+    def close(self) -> None:
+        if self.kqueue is not None:
+            self.kqueue.close()
+            self.kqueue = None
+
+    def __enter__(self) -> "FileAppendWaiter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
 def get_config_path(
     mcp_host: McpHostChoices,
     is_verbose: bool = False,
@@ -245,6 +319,11 @@ def read_config_file(path: Path, is_verbose: bool = False) -> dict:
         raise Exit(1) from e
 
 
+def write_config_file(path: Path, config_data: dict) -> None:
+    """설정 파일을 저장합니다. 설정 폴더가 없다면 FileNotFoundError 예외가 발생합니다."""
+    path.write_text(json.dumps(config_data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
 def get_editor_commands() -> list[str]:
     """시스템에서 사용 가능한 에디터 명령어 목록을 반환합니다."""
 
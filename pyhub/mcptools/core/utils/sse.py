@@ -1,8 +1,27 @@
+import socket
 from typing import Optional
+from urllib.parse import urlparse
 
 import httpx
 
 
+def is_tcp_port_open(url: str, timeout: float = 1.0) -> bool:
+    """URL의 호스트/포트로 TCP 연결만 시도합니다.
+
+    서버가 실행 중이지 않을 때 HTTP 요청 없이 빠르게 판단할 수 있습니다.
+    """
+    parsed = urlparse(url)
+    if not parsed.hostname:
+        return False
+
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        with socket.create_connection((parsed.hostname, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 async def is_mcp_sse_server_alive(sse_url: str, timeout: float = 3.0) -> bool:
     last_event_name: Optional[str] = None
 
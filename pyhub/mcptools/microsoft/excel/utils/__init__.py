@@ -12,6 +12,13 @@ import xlwings as xw
 from django.template import Context, Template
 from django.template.loader import render_to_string
 
+# Regex patterns for sheet range parsing (ex: "Sheet1!A1:B10")
+EXCEL_RANGE_PATTERN = re.compile(
+    r"(?:(?:'[^']+'|[a-zA-Z0-9_.\-]+)!)?(\$?[A-Z]{1,3}\$?[1-9][0-9]{0,6})(?::(\$?[A-Z]{1,3}\$?[1-9][0-9]{0,6}))?"
+)
+CELL_COLUMN_PATTERN = re.compile(r"[A-Z]+")
+CELL_ROW_PATTERN = re.compile(r"[0-9]+")
+
 
 def get_sheet(
     book_name: Optional[str] = None,
@@ -79,10 +86,7 @@ def fix_data(sheet_range: str, values: Union[str, list]) -> Union[str, list]:
         return values
 
     # range가 범위를 포함하는지 확인
-    range_pattern = (
-        r"(?:(?:'[^']+'|[a-zA-Z0-9_.\-]+)!)?(\$?[A-Z]{1,3}\$?[1-9][0-9]{0,6})(?::(\$?[A-Z]{1,3}\$?[1-9][0-9]{0,6}))?"
-    )
-    match = re.match(range_pattern, sheet_range)
+    match = EXCEL_RANGE_PATTERN.match(sheet_range)
 
     if not match:
         return values
@@ -97,11 +101,11 @@ def fix_data(sheet_range: str, values: Union[str, list]) -> Union[str, list]:
         return values
 
     # 열 방향 범위인지 확인 (예: A1:A10)
-    start_col = re.search(r"[A-Z]+", start_cell).group(0)
-    end_col = re.search(r"[A-Z]+", end_cell).group(0)
+    start_col = CELL_COLUMN_PATTERN.search(start_cell).group(0)
+    end_col = CELL_COLUMN_PATTERN.search(end_cell).group(0)
 
-    start_row = re.search(r"[0-9]+", start_cell).group(0)
-    end_row = re.search(r"[0-9]+", end_cell).group(0)
+    start_row = CELL_ROW_PATTERN.search(start_cell).group(0)
+    end_row = CELL_ROW_PATTERN.search(end_cell).group(0)
 
     # 열이 같고 행이 다르면 열 방향 범위
     if start_col == end_col and start_row != end_row: